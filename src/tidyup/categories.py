@@ -4,58 +4,259 @@ Provides dynamic category configuration that can be stored in config
 and modified via CLI commands.
 """
 
+import contextlib
+import json
+import os
+import re
+import struct
+import sys
+import tempfile
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# Use the libyaml-backed loader/dumper when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Default categories in order (position determines number)
-DEFAULT_CATEGORIES = [
-    "Documents",
-    "Screenshots",
-    "Images",
-    "Videos",
-    "Audio",
-    "Archives",
-    "Code",
-    "Books",
-    "Papers",
-    "Data",
-    "Installers",
-]
+DEFAULT_CATEGORIES: tuple[str, ...] = tuple(
+    sys.intern(name)
+    for name in (
+        "Documents",
+        "Screenshots",
+        "Images",
+        "Videos",
+        "Audio",
+        "Archives",
+        "Code",
+        "Books",
+        "Papers",
+        "Data",
+        "Installers",
+    )
+)
 
 # Unsorted is always last at 99
-UNSORTED_CATEGORY = "Unsorted"
+UNSORTED_CATEGORY = sys.intern("Unsorted")
 UNSORTED_NUMBER = 99
+_UNSORTED_LOWER = UNSORTED_CATEGORY.lower()
+
+# Category folder name: NN_Name (captures Name)
+_FOLDER_RE = re.compile(r"\d+_(.+)", re.DOTALL)
+
+# Last parsed config per path: path -> (st_mtime_ns, st_size, config)
+_CONFIG_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+# Parsed-category cache header: (st_mtime_ns, st_size) of config.yaml
+_CACHE_HEADER = struct.Struct("<qq")
+# Cache payload for a config without custom categories
+_DEFAULTS_MARKER = b"DEFAULTS"
+
+
+def _default_config_path() -> Path:
+    """Return ~/.tidy/config.yaml for the current HOME."""
+    return Path.home() / ".tidy" / "config.yaml"
+
+
+def _new_file_mode() -> int:
+    """Return the mode open() would give a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _cache_path(config_path: Path) -> Path:
+    """Return the parsed-category cache path for a config file."""
+    return config_path.with_suffix(".cache")
+
+
+def _load_cached(config_path: Path, mtime_ns: int, size: int) -> list[str] | None:
+    """Load cached category names if they match the config's mtime and size.
+
+    Args:
+        config_path: Path to config.yaml.
+        mtime_ns: Current st_mtime_ns of config.yaml.
+        size: Current st_size of config.yaml.
+
+    Returns:
+        Cached category names, or None on a miss or unreadable cache.
+    """
+    try:
+        data = _cache_path(config_path).read_bytes()
+        if _CACHE_HEADER.unpack_from(data) != (mtime_ns, size):
+            return None
+        payload = data[_CACHE_HEADER.size:]
+        if payload == _DEFAULTS_MARKER:
+            return list(DEFAULT_CATEGORIES)
+        names = json.loads(payload)
+    except (OSError, struct.error, ValueError):
+        return None
+    if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+        return None
+    return names
+
+
+def _store_cached(
+    config_path: Path, mtime_ns: int, size: int, names: list[str] | None
+) -> None:
+    """Write category names to the cache, keyed by the config's mtime and size.
+
+    None (no custom categories) is stored as a short marker. The cache is
+    only an optimization, so write failures are ignored.
+    """
+    cache_path = _cache_path(config_path)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    payload = _DEFAULTS_MARKER if names is None else json.dumps(names).encode()
+    try:
+        tmp_path.write_bytes(_CACHE_HEADER.pack(mtime_ns, size) + payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _category_names_from_config(config: dict) -> list[str] | None:
+    """Extract category names from a parsed config.
+
+    Returns:
+        Category names, or None if the config has no custom categories.
+    """
+    if "categories" not in config or not config["categories"]:
+        return None
+
+    # Extract names from config (can be strings or dicts)
+    category_names = []
+    for item in config["categories"]:
+        if isinstance(item, str):
+            category_names.append(item)
+        elif isinstance(item, dict) and "name" in item:
+            # YAML turns bare names like 2024 into ints; Category needs a str
+            category_names.append(str(item["name"]))
+    return category_names
+
 
+def _read_config(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Parse a config file, reusing the last parse while mtime and size match.
 
-@dataclass
+    Callers that modify the result must copy it first.
+
+    Raises:
+        yaml.YAMLError: If the config is not valid YAML.
+        OSError: If the config cannot be read.
+    """
+    hit = _CONFIG_CACHE.get(path_str)
+    if hit is not None and hit[0] == mtime_ns and hit[1] == size:
+        return hit[2]
+
+    with open(path_str) as f:
+        config: dict = yaml.load(f, Loader=_Loader) or {}
+    _CONFIG_CACHE[path_str] = (mtime_ns, size, config)
+    return config
+
+
+def _remember_config(path_str: str, mtime_ns: int, size: int, config: dict) -> None:
+    """Record a config just written, so the next read skips parsing it."""
+    # Shallow copy: save() only ever replaces top-level keys
+    _CONFIG_CACHE[path_str] = (mtime_ns, size, dict(config))
+
+
+@lru_cache(maxsize=32)
+def _parse_config(path_str: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Return category names from a config file, memoized per process.
+
+    Keyed by path, mtime and size so an edited config is re-read. Misses
+    fall through to the on-disk cache and then to a YAML parse.
+
+    Raises:
+        yaml.YAMLError: If the config is not valid YAML.
+        OSError: If the config cannot be read.
+    """
+    config_path = Path(path_str)
+    cached = _load_cached(config_path, mtime_ns, size)
+    if cached is not None:
+        return tuple(cached)
+
+    config = _read_config(path_str, mtime_ns, size)
+    category_names = _category_names_from_config(config)
+    _store_cached(config_path, mtime_ns, size, category_names)
+    if category_names is None:
+        return DEFAULT_CATEGORIES
+    return tuple(category_names)
+
+
+def _plan_renames(
+    renames: list[tuple[Path, Path]], existing_names: Iterable[str]
+) -> tuple[list[tuple[Path, Path]], list[tuple[Path, Path]]]:
+    """Split renames into those that can run and those whose target is taken.
+
+    Every target is an NN_Name folder for one category, and a folder is only
+    renamed when its own name is wrong, so an occupied target never belongs
+    to a folder that is itself moving away. A rename is skipped if another
+    rename shares its target (duplicate category folders) or any other entry
+    already has that name, compared case-insensitively to be safe on
+    case-insensitive filesystems. A case-only rename of the folder itself is
+    allowed.
+
+    Args:
+        renames: Candidate (old_path, new_path) pairs.
+        existing_names: Names of all entries in the directory, from the scan
+            that produced the renames, so no per-target stat is needed.
+
+    Returns:
+        (planned, skipped) renames, each sorted by old folder name.
+    """
+    targets: dict[Path, int] = {}
+    for _, dst in renames:
+        targets[dst] = targets.get(dst, 0) + 1
+
+    names_by_fold: dict[str, list[str]] = {}
+    for name in existing_names:
+        names_by_fold.setdefault(name.casefold(), []).append(name)
+
+    planned: list[tuple[Path, Path]] = []
+    skipped: list[tuple[Path, Path]] = []
+    for src, dst in sorted(renames, key=lambda r: r[0].name):
+        occupants = names_by_fold.get(dst.name.casefold(), ())
+        if targets[dst] > 1 or any(name != src.name for name in occupants):
+            skipped.append((src, dst))
+        else:
+            planned.append((src, dst))
+    return planned, skipped
+
+
+@dataclass(slots=True, eq=False)
 class Category:
     """A file category with number and name.
 
     Attributes:
         number: The category number (01-98, or 99 for Unsorted).
         name: The display name of the category.
+        name_lower: Lowercased name, computed once for case-insensitive lookups.
+        folder_name: The folder name in NN_Name format, kept in sync by the
+            manager when categories are renumbered.
     """
 
     number: int
     name: str
+    name_lower: str = field(init=False, repr=False, compare=False)
+    folder_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def folder_name(self) -> str:
-        """Return the folder name in NN_Name format."""
-        return f"{self.number:02d}_{self.name}"
+    def __post_init__(self) -> None:
+        """Intern the name and precompute its lowercased and folder forms."""
+        self.name = sys.intern(self.name)
+        self.name_lower = self.name.lower()
+        self._refresh_folder_name()
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Category):
-            return self.name == other.name
-        return False
+    def _refresh_folder_name(self) -> None:
+        """Recompute the cached folder name after number or name changes."""
+        self.folder_name = f"{self.number:02d}_{self.name}"
 
-    def __hash__(self) -> int:
-        return hash(self.name)
 
 
-@dataclass
+@dataclass(slots=True)
 class CategoryManager:
     """Manages file categories with config persistence.
 
@@ -69,11 +270,53 @@ class CategoryManager:
 
     categories: list[Category] = field(default_factory=list)
     config_path: Path | None = None
+    _by_lower: dict[str, Category] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _raw_config: dict | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    _snapshot: tuple[Category, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Set default config path if not provided."""
         if self.config_path is None:
-            self.config_path = Path.home() / ".tidy" / "config.yaml"
+            self.config_path = _default_config_path()
+        self._set_categories(self.categories)
+
+    def _set_categories(self, categories: list[Category]) -> None:
+        """Replace the category list and rebuild the name index."""
+        self.categories = categories
+        self._by_lower = {c.name_lower: c for c in categories}
+        self._snapshot = None
+
+    def _regular_count(self) -> int:
+        """Return the number of categories excluding trailing Unsorted."""
+        if self.categories and self.categories[-1].name == UNSORTED_CATEGORY:
+            return len(self.categories) - 1
+        return len(self.categories)
+
+    def _renumber(self) -> None:
+        """Renumber regular categories 1..n in place, leaving Unsorted at 99."""
+        for i, cat in enumerate(self.categories[:self._regular_count()], start=1):
+            if cat.number != i:
+                cat.number = i
+                cat._refresh_folder_name()
+
+    def _commit(self, regular_cats: list[Category]) -> None:
+        """Install a new regular-category list ahead of Unsorted.
+
+        Renumbers in place, refreshes the name index and marks the
+        manager dirty so the next save() writes.
+        """
+        self.categories[:self._regular_count()] = regular_cats
+        self._renumber()
+        self._by_lower = {c.name_lower: c for c in self.categories}
+        self._snapshot = None
+        self._dirty = True
 
     def load(self) -> None:
         """Load categories from config file or use defaults.
@@ -81,62 +324,112 @@ class CategoryManager:
         If config file doesn't exist or has no categories section,
         uses DEFAULT_CATEGORIES.
         """
-        category_names = DEFAULT_CATEGORIES.copy()
+        category_names = DEFAULT_CATEGORIES
+        self._raw_config = None
+        # Nothing to save until a mutation, unless the config is missing or broken
+        self._dirty = True
 
         if self.config_path and self.config_path.exists():
             try:
-                with open(self.config_path) as f:
-                    config = yaml.safe_load(f) or {}
-
-                if "categories" in config and config["categories"]:
-                    # Extract names from config (can be strings or dicts)
-                    category_names = []
-                    for item in config["categories"]:
-                        if isinstance(item, str):
-                            category_names.append(item)
-                        elif isinstance(item, dict) and "name" in item:
-                            category_names.append(item["name"])
+                # Reuse the parsed result while config.yaml is unchanged
+                st = self.config_path.stat()
+                category_names = _parse_config(
+                    str(self.config_path), st.st_mtime_ns, st.st_size
+                )
+                self._dirty = False
             except (yaml.YAMLError, OSError):
                 # Fall back to defaults on any error
-                category_names = DEFAULT_CATEGORIES.copy()
+                category_names = DEFAULT_CATEGORIES
 
         # Build categories with numbers
-        self.categories = []
+        categories = []
         for i, name in enumerate(category_names, start=1):
-            self.categories.append(Category(number=i, name=name))
+            categories.append(Category(number=i, name=name))
 
         # Always add Unsorted at 99
-        self.categories.append(Category(number=UNSORTED_NUMBER, name=UNSORTED_CATEGORY))
+        categories.append(Category(number=UNSORTED_NUMBER, name=UNSORTED_CATEGORY))
+        self._set_categories(categories)
+
+    def mark_dirty(self) -> None:
+        """Force the next save() to write, e.g. after editing categories directly."""
+        self._dirty = True
 
     def save(self) -> None:
         """Save categories to config file.
 
         Creates config directory if it doesn't exist.
-        Preserves other config sections.
+        Preserves other config sections. Does nothing if the categories
+        have not changed since they were loaded or last saved.
         """
-        if not self.config_path:
+        if not self.config_path or not self._dirty:
             return
 
         # Ensure directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load existing config to preserve other sections
-        config: dict = {}
-        if self.config_path.exists():
-            try:
-                with open(self.config_path) as f:
-                    config = yaml.safe_load(f) or {}
-            except (yaml.YAMLError, OSError):
-                config = {}
+        # Write through a symlinked config (e.g. managed dotfiles) to its target
+        target = self.config_path.resolve()
+
+        try:
+            st: os.stat_result | None = target.stat()
+        except OSError:
+            st = None
+
+        # Reuse the config written by the last save, else load the existing
+        # config (memoized if load() parsed it) to preserve other sections
+        config = self._raw_config
+        if config is None:
+            config = {}
+            if st is not None:
+                try:
+                    config = dict(
+                        _read_config(str(self.config_path), st.st_mtime_ns, st.st_size)
+                    )
+                except (yaml.YAMLError, OSError):
+                    config = {}
 
         # Update categories section (exclude Unsorted, it's implicit)
         config["categories"] = [
             cat.name for cat in self.categories if cat.name != UNSORTED_CATEGORY
         ]
 
-        # Write config
-        with open(self.config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        # Write to a temp file and swap it in, so readers never see a torn file
+        fd, tmp_name = tempfile.mkstemp(
+            dir=target.parent, prefix=".config.", suffix=".yaml"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yaml.dump(
+                    config,
+                    f,
+                    Dumper=_Dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                    encoding="utf-8",
+                )
+            # mkstemp creates 0600; keep the old mode or use a normal file's
+            os.chmod(tmp_name, st.st_mode & 0o777 if st is not None else _new_file_mode())
+            os.replace(tmp_name, target)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+        self._raw_config = config
+        self._dirty = False
+
+        # Seed both caches so the next load() or save() skips YAML
+        with contextlib.suppress(OSError):
+            new_st = self.config_path.stat()
+            # Normalize like a YAML parse would, so an empty list caches as defaults
+            _store_cached(
+                self.config_path,
+                new_st.st_mtime_ns,
+                new_st.st_size,
+                _category_names_from_config(config),
+            )
+            _remember_config(
+                str(self.config_path), new_st.st_mtime_ns, new_st.st_size, config
+            )
 
     def get_by_name(self, name: str) -> Category | None:
         """Get category by name (case-insensitive).
@@ -147,11 +440,7 @@ class CategoryManager:
         Returns:
             Category if found, None otherwise.
         """
-        name_lower = name.lower()
-        for cat in self.categories:
-            if cat.name.lower() == name_lower:
-                return cat
-        return None
+        return self._by_lower.get(name.lower())
 
     def get_folder_name(self, name: str) -> str:
         """Get folder name for a category.
@@ -187,30 +476,23 @@ class CategoryManager:
         if self.get_by_name(name) is not None:
             raise ValueError(f"Category already exists: {name}")
 
-        # Filter out Unsorted for positioning
-        regular_cats = [c for c in self.categories if c.name != UNSORTED_CATEGORY]
+        regular_count = self._regular_count()
 
         # Determine position
         if position is None:
-            position = len(regular_cats) + 1
-        elif position < 1 or position > len(regular_cats) + 1:
+            position = regular_count + 1
+        elif position < 1 or position > regular_count + 1:
             raise ValueError(
-                f"Position must be between 1 and {len(regular_cats) + 1}"
+                f"Position must be between 1 and {regular_count + 1}"
             )
 
         # Insert at position (convert to 0-based index)
         new_cat = Category(number=position, name=name)
+        regular_cats = self.categories[:regular_count]
         regular_cats.insert(position - 1, new_cat)
+        self._commit(regular_cats)
 
-        # Renumber all categories
-        self.categories = []
-        for i, cat in enumerate(regular_cats, start=1):
-            self.categories.append(Category(number=i, name=cat.name))
-
-        # Add back Unsorted
-        self.categories.append(Category(number=UNSORTED_NUMBER, name=UNSORTED_CATEGORY))
-
-        return self.get_by_name(name)  # type: ignore
+        return new_cat
 
     def remove(self, name: str) -> None:
         """Remove a category.
@@ -221,26 +503,16 @@ class CategoryManager:
         Raises:
             ValueError: If category not found or is Unsorted.
         """
-        if name.lower() == UNSORTED_CATEGORY.lower():
+        if name.lower() == _UNSORTED_LOWER:
             raise ValueError("Cannot remove Unsorted category")
 
         cat = self.get_by_name(name)
         if cat is None:
             raise ValueError(f"Category not found: {name}")
 
-        # Filter out the category and Unsorted
-        regular_cats = [
-            c for c in self.categories
-            if c.name != name and c.name != UNSORTED_CATEGORY
-        ]
-
-        # Renumber remaining categories
-        self.categories = []
-        for i, cat in enumerate(regular_cats, start=1):
-            self.categories.append(Category(number=i, name=cat.name))
-
-        # Add back Unsorted
-        self.categories.append(Category(number=UNSORTED_NUMBER, name=UNSORTED_CATEGORY))
+        regular_cats = self.categories[:self._regular_count()]
+        regular_cats.remove(cat)
+        self._commit(regular_cats)
 
     def reorder(self, new_order: list[str]) -> None:
         """Reorder categories according to the given name list.
@@ -253,7 +525,7 @@ class CategoryManager:
         """
         # Get current regular categories
         regular_cats = {
-            c.name.lower(): c.name
+            c.name_lower: c.name
             for c in self.categories
             if c.name != UNSORTED_CATEGORY
         }
@@ -261,9 +533,12 @@ class CategoryManager:
         # Validate new order
         new_order_lower = [n.lower() for n in new_order]
 
-        if set(new_order_lower) != set(regular_cats.keys()):
-            missing = set(regular_cats.keys()) - set(new_order_lower)
-            extra = set(new_order_lower) - set(regular_cats.keys())
+        new_set = set(new_order_lower)
+        current = regular_cats.keys()
+
+        if current != new_set:
+            missing = current - new_set
+            extra = new_set - current
             msg = []
             if missing:
                 msg.append(f"Missing: {', '.join(regular_cats[m] for m in missing)}")
@@ -271,89 +546,71 @@ class CategoryManager:
                 msg.append(f"Unknown: {', '.join(extra)}")
             raise ValueError("; ".join(msg))
 
-        # Rebuild with new order
-        self.categories = []
-        for i, name_lower in enumerate(new_order_lower, start=1):
-            original_name = regular_cats[name_lower]
-            self.categories.append(Category(number=i, name=original_name))
-
-        # Add back Unsorted
-        self.categories.append(Category(number=UNSORTED_NUMBER, name=UNSORTED_CATEGORY))
+        # Reuse the existing Category objects in the new order
+        self._commit([self._by_lower[name_lower] for name_lower in new_order_lower])
 
     def apply_to_filesystem(
         self,
         dest: Path,
         dry_run: bool = False,
-    ) -> list[tuple[Path, Path]]:
+    ) -> tuple[list[tuple[Path, Path]], list[tuple[Path, Path]]]:
         """Rename existing folders to match current category numbering.
 
         This handles the case where category order has changed and
-        existing folders need to be renamed.
+        existing folders need to be renamed. Folders whose target name is
+        already taken (e.g. duplicate category folders) are left in place.
 
         Args:
             dest: Destination directory containing category folders.
             dry_run: If True, return what would be renamed without doing it.
 
         Returns:
-            List of (old_path, new_path) tuples for renamed folders.
+            (renamed, skipped) lists of (old_path, new_path) tuples.
         """
         if not dest.exists():
-            return []
+            return [], []
 
         renames: list[tuple[Path, Path]] = []
 
-        # Build mapping of name -> expected folder name
-        expected = {cat.name.lower(): cat.folder_name for cat in self.categories}
-
-        # Find existing category folders
-        for item in dest.iterdir():
-            if not item.is_dir():
-                continue
+        # Name index maps lowercase name -> category (and its folder name)
+        expected = self._by_lower
 
-            # Parse folder name (NN_Name format)
-            parts = item.name.split("_", 1)
-            if len(parts) != 2:
-                continue
+        # Find existing category folders in a single directory read
+        existing_names: list[str] = []
+        with os.scandir(dest) as it:
+            for entry in it:
+                existing_names.append(entry.name)
 
-            try:
-                int(parts[0])  # Validate number prefix
-            except ValueError:
-                continue
+                # Parse folder name (NN_Name format)
+                match = _FOLDER_RE.match(entry.name)
+                if match is None:
+                    continue
 
-            folder_name = parts[1]
-            folder_name_lower = folder_name.lower()
+                # Check if this category exists and needs renaming
+                cat = expected.get(match.group(1).lower())
+                if cat is None or entry.name == cat.folder_name:
+                    continue
 
-            # Check if this category exists and needs renaming
-            if folder_name_lower in expected:
-                expected_name = expected[folder_name_lower]
-                if item.name != expected_name:
-                    new_path = dest / expected_name
-                    renames.append((item, new_path))
+                if entry.is_dir():
+                    renames.append((Path(entry.path), dest / cat.folder_name))
 
-        # Sort renames to avoid conflicts (rename to temp first if needed)
-        # For now, simple approach: rename in reverse number order
-        renames.sort(key=lambda x: x[0].name, reverse=True)
+        planned, skipped = _plan_renames(renames, existing_names)
 
         if not dry_run:
-            # Execute renames (may need temp names to avoid conflicts)
-            for old_path, new_path in renames:
-                if new_path.exists():
-                    # Use temp name to avoid conflict
-                    temp_path = dest / f"_temp_{old_path.name}"
-                    old_path.rename(temp_path)
-                    # Will be renamed properly in second pass
-                else:
-                    old_path.rename(new_path)
+            for old_path, new_path in planned:
+                old_path.rename(new_path)
 
-        return renames
+        return planned, skipped
 
-    def list_categories(self) -> list[Category]:
-        """Return all categories in order.
+    def list_categories(self) -> tuple[Category, ...]:
+        """Return an immutable snapshot of all categories in order.
 
         Returns:
-            List of Category objects.
+            Tuple of Category objects, reused until the next mutation.
         """
-        return self.categories.copy()
+        if self._snapshot is None:
+            self._snapshot = tuple(self.categories)
+        return self._snapshot
 
     def get_default_folders(self) -> list[dict]:
         """Return categories in the legacy DEFAULT_FOLDERS format.
@@ -390,3 +647,5 @@ def reset_category_manager() -> None:
     """Reset the global CategoryManager (for testing)."""
     global _manager
     _manager = None
+    _parse_config.cache_clear()
+    _CONFIG_CACHE.clear()
@@ -1,11 +1,80 @@
 """Command-line interface for TidyUp."""
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
 import click
 
 from . import __version__
 
+# Rich styles for action statuses in the results table
+_STATUS_STYLES = {
+    "success": "green",
+    "error": "red bold",
+    "skipped": "dim",
+}
+
+# Category colors for visual grouping in the actions table
+_CATEGORY_COLORS = {
+    "Documents": "blue",
+    "Screenshots": "magenta",
+    "Images": "green",
+    "Videos": "red",
+    "Audio": "yellow",
+    "Archives": "cyan",
+    "Code": "bright_green",
+    "Books": "bright_blue",
+    "Papers": "bright_cyan",
+    "Data": "bright_yellow",
+    "Installers": "bright_red",
+    "Unsorted": "dim",
+}
+
+# Path separators that mark an argument as a path without touching the disk
+_PATH_SEPARATORS = frozenset({"/", os.sep})
+
+
+def _looks_like_path(arg: str) -> bool:
+    """Return True if a CLI argument should be treated as a source path.
+
+    Cheap string tests come first; the filesystem is only consulted for
+    bare names such as ``Downloads``.
+    """
+    if arg in (".", "..") or arg.startswith("~"):
+        return True
+    if any(sep in arg for sep in _PATH_SEPARATORS):
+        return True
+    return Path(arg).exists()
+
+
+def _walk_files(root: Path | str) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every regular file below root, recursively.
+
+    Symlinks are never followed, so ``entry.stat(follow_symlinks=False)``
+    can be answered from the scandir data where the platform provides it.
+    Directories that vanish or cannot be read are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk_files(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+    except (PermissionError, FileNotFoundError):
+        return
+
+
+def _folder_stats(root: Path | str) -> tuple[int, int]:
+    """Return (file count, total bytes) for every regular file below root."""
+    file_count = 0
+    folder_size = 0
+    for entry in _walk_files(root):
+        file_count += 1
+        folder_size += entry.stat(follow_symlinks=False).st_size
+    return file_count, folder_size
+
 
 class TidyGroup(click.Group):
     """Custom Click group that handles both subcommands and the default organize action."""
@@ -13,9 +82,9 @@ class TidyGroup(click.Group):
     def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
         """Parse arguments, treating paths as the organize command."""
         # If first arg looks like a path (not a known command), insert 'run' command
-        if args and args[0] not in self.commands and not args[0].startswith("-"):
-            # Check if it could be a path
-            if args[0] == "." or "/" in args[0] or Path(args[0]).exists():
+        if args:
+            first = args[0]
+            if first not in self.commands and not first.startswith("-") and _looks_like_path(first):
                 args = ["run"] + args
         return super().parse_args(ctx, args)
 
@@ -82,15 +151,15 @@ def run_command(
 def run_organize(source: Path, destination: Path | None, options: dict) -> None:
     """Execute the organize operation."""
     from rich.console import Console
-    from rich.table import Table
-
-    from .engine import Engine
 
     console = Console()
 
-    # Determine operation mode
-    do_move = options.get("move", False)
-    do_rename = options.get("rename", False)
+    # Read the flags once
+    do_move = bool(options.get("move"))
+    do_rename = bool(options.get("rename"))
+    dry_run = bool(options.get("dry_run"))
+    skip = bool(options.get("skip"))
+    verbose = bool(options.get("verbose"))
 
     # Default: both move and rename
     if not do_move and not do_rename:
@@ -101,11 +170,16 @@ def run_organize(source: Path, destination: Path | None, options: dict) -> None:
     if destination is None and do_move:
         destination = Path.home() / "Documents" / "Organized"
 
-    console.print(f"[bold]TidyUp[/bold] v{__version__}")
-    console.print(f"Source: {source.resolve()}")
+    # Resolve once; the engine then works on the same absolute paths we display
+    source = source.resolve()
+    if destination is not None:
+        destination = destination.resolve()
+
+    # Build the header as one block so Rich renders it in a single pass
+    header = [f"[bold]TidyUp[/bold] v{__version__}", f"Source: {source}"]
 
     if do_move:
-        console.print(f"Destination: {destination.resolve() if destination else 'N/A'}")
+        header.append(f"Destination: {destination}")
 
     # Show operation mode
     if do_move and do_rename:
@@ -114,20 +188,28 @@ def run_organize(source: Path, destination: Path | None, options: dict) -> None:
         mode = "Move only (keep original names)"
     else:
         mode = "Rename only (in place)"
-    console.print(f"Mode: {mode}")
+    header.append(f"Mode: {mode}")
 
-    if options.get("dry_run"):
-        console.print("[yellow]DRY RUN - no files will be changed[/yellow]")
+    if dry_run:
+        header.append("[yellow]DRY RUN - no files will be changed[/yellow]")
 
-    if options.get("skip"):
-        console.print("[dim]Skipping uncertain files[/dim]")
+    if skip:
+        header.append("[dim]Skipping uncertain files[/dim]")
 
+    console.print("\n".join(header))
     console.print()
 
+    if options.get("limit") == 0:
+        console.print("Nothing to do (--limit 0)")
+        return
+
+    # Imported late so the header shows before the detection stack loads
+    from .engine import Engine
+
     # Run the engine with progress bar for non-dry-run
     engine = Engine(source, destination=destination, options=options)
 
-    if options.get("dry_run"):
+    if dry_run:
         # Dry run: no progress bar, just run
         result = engine.run()
     else:
@@ -148,47 +230,32 @@ def run_organize(source: Path, destination: Path | None, options: dict) -> None:
             progress.update(task, completed=result.summary.processed)
 
     # Display results
-    if options.get("verbose") or options.get("dry_run"):
+    if verbose or dry_run:
         # Show individual actions
         if result.actions:
-            table = Table(title="Actions" if not options.get("dry_run") else "Dry Run Preview")
+            from rich.table import Table
+
+            table = Table(title="Actions" if not dry_run else "Dry Run Preview")
             table.add_column("File", style="cyan")
             table.add_column("Category")
             table.add_column("Status")
             table.add_column("Destination")
 
-            # Category colors for visual grouping
-            category_colors = {
-                "Documents": "blue",
-                "Screenshots": "magenta",
-                "Images": "green",
-                "Videos": "red",
-                "Audio": "yellow",
-                "Archives": "cyan",
-                "Code": "bright_green",
-                "Books": "bright_blue",
-                "Papers": "bright_cyan",
-                "Data": "bright_yellow",
-                "Installers": "bright_red",
-                "Unsorted": "dim",
-            }
-
             for action in result.actions:
-                status_style = {
-                    "success": "green",
-                    "error": "red bold",
-                    "skipped": "dim",
-                }.get(action.status, "white")
+                status = action.status
+                status_style = _STATUS_STYLES.get(status, "white")
 
-                cat_color = category_colors.get(action.detection.category, "white")
+                category = action.detection.category
+                cat_color = _CATEGORY_COLORS.get(category, "white")
 
                 # Show actual destination: parent folder + filename
-                dest_display = f"{action.dest_path.parent.name}/{action.dest_path.name}"
+                dest_path = action.dest_path
+                dest_display = dest_path.parent.name + "/" + dest_path.name
 
                 table.add_row(
                     action.file.name,
-                    f"[{cat_color}]{action.detection.category}[/{cat_color}]",
-                    f"[{status_style}]{action.status}[/{status_style}]",
+                    f"[{cat_color}]{category}[/{cat_color}]",
+                    f"[{status_style}]{status}[/{status_style}]",
                     dest_display,
                 )
 
@@ -197,35 +264,38 @@ def run_organize(source: Path, destination: Path | None, options: dict) -> None:
 
     # Show summary
     summary = result.summary
-    console.print("[bold]Summary[/bold]")
-    console.print(f"  Processed: {summary.processed}")
-    console.print(f"  Moved:     {summary.moved}")
-    console.print(f"  Renamed:   {summary.renamed}")
+    lines = [
+        "[bold]Summary[/bold]",
+        f"  Processed: {summary.processed}",
+        f"  Moved:     {summary.moved}",
+        f"  Renamed:   {summary.renamed}",
+    ]
     if summary.unsorted > 0:
-        console.print(f"  Unsorted:  {summary.unsorted}")
+        lines.append(f"  Unsorted:  {summary.unsorted}")
     if summary.skipped > 0:
-        console.print(f"  Skipped:   {summary.skipped}")
+        lines.append(f"  Skipped:   {summary.skipped}")
     if summary.errors > 0:
-        console.print(f"  [red]Errors:    {summary.errors}[/red]")
+        lines.append(f"  [red]Errors:    {summary.errors}[/red]")
     if summary.duplicates > 0:
-        console.print(f"  Duplicates: {summary.duplicates}")
+        lines.append(f"  Duplicates: {summary.duplicates}")
+    console.print("\n".join(lines))
 
 
 @main.command()
 def status() -> None:
     """Show organization statistics from logs."""
     from rich.console import Console
-    from rich.table import Table
 
     from .logger import aggregate_logs, get_tidy_dir, list_logs, load_log
     from .utils import format_size
 
     console = Console()
 
-    # Default destination
+    # Default destination; config and logs live under ~/.tidy
     dest = Path.home() / "Documents" / "Organized"
-    config_path = Path.home() / ".tidy" / "config.yaml"
-    logs_dir = get_tidy_dir() / "logs"
+    tidy_dir = get_tidy_dir()
+    config_path = tidy_dir / "config.yaml"
+    logs_dir = tidy_dir / "logs"
 
     # Count log files
     log_count = len(list_logs()) if logs_dir.exists() else 0
@@ -241,6 +311,8 @@ def status() -> None:
 
     # Scan destination folders for stats
     if dest.exists():
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold")
         table.add_column("Folder", style="cyan")
         table.add_column("Files", justify="right")
@@ -249,21 +321,24 @@ def status() -> None:
         total_files = 0
         total_size = 0
 
-        # Get all numbered folders sorted
-        folders = sorted(
-            [f for f in dest.iterdir() if f.is_dir() and not f.name.startswith(".")],
-            key=lambda f: f.name,
-        )
+        # Get all numbered folders sorted; each subtree is then walked once
+        with os.scandir(dest) as it:
+            folders = sorted(
+                (e for e in it if e.name[:1] != "." and e.is_dir()),
+                key=lambda e: e.name,
+            )
+
+        # Folder walks are independent and syscall bound, so threads overlap them
+        paths = [folder.path for folder in folders]
+        if len(paths) > 1:
+            from concurrent.futures import ThreadPoolExecutor
 
-        for folder in folders:
-            # Count files and size
-            file_count = 0
-            folder_size = 0
-            for item in folder.rglob("*"):
-                if item.is_file():
-                    file_count += 1
-                    folder_size += item.stat().st_size
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+                folder_stats = list(executor.map(_folder_stats, paths))
+        else:
+            folder_stats = [_folder_stats(path) for path in paths]
 
+        for folder, (file_count, folder_size) in zip(folders, folder_stats):
             total_files += file_count
             total_size += folder_size
 
@@ -415,19 +490,20 @@ def categories_apply(path: Path, dry_run: bool) -> None:
     This is useful after adding, removing, or reordering categories.
     """
     from rich.console import Console
-    from rich.table import Table
 
     from .categories import get_category_manager
 
     console = Console()
     manager = get_category_manager()
 
-    changes = manager.apply_to_filesystem(path, dry_run=dry_run)
+    changes, skipped = manager.apply_to_filesystem(path, dry_run=dry_run)
 
-    if not changes:
+    if not changes and not skipped:
         console.print("[dim]No folders need renaming.[/dim]")
         return
 
+    from rich.table import Table
+
     if dry_run:
         console.print("[yellow]DRY RUN - no changes will be made[/yellow]")
 
@@ -440,11 +516,19 @@ def categories_apply(path: Path, dry_run: bool) -> None:
         status = "[dim]would rename[/dim]" if dry_run else "[green]renamed[/green]"
         table.add_row(str(old_name), str(new_name), status)
 
+    for old_name, new_name in skipped:
+        table.add_row(str(old_name), str(new_name), "[yellow]skipped[/yellow]")
+
     console.print(table)
 
-    if not dry_run:
+    if changes and not dry_run:
         console.print(f"\n[green]Renamed {len(changes)} folder(s)[/green]")
 
+    if skipped:
+        console.print(
+            f"\n[yellow]Skipped {len(skipped)} folder(s): target name already in use. "
+            "Merge or rename them by hand.[/yellow]"
+        )
 
 if __name__ == "__main__":
     main()
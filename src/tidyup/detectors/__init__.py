@@ -37,11 +37,13 @@ class DetectorRegistry:
         self.detectors.sort(key=lambda d: d.priority)
 
     def detect(self, file: FileInfo) -> DetectionResult:
-        """Run all detectors and return the best result.
+        """Run detectors and return the best result.
 
         Detectors are run in priority order. The result with the
         highest confidence wins. In case of ties, the more specific
-        detector (lower priority number) wins.
+        detector (lower priority number) wins. Since CONFIDENCE_HIGH is
+        the highest confidence a detector reports, the first high
+        confidence result is returned without running the rest.
 
         Args:
             file: FileInfo for the file to detect.
@@ -49,14 +51,19 @@ class DetectorRegistry:
         Returns:
             Best DetectionResult, or a default "Unsorted" result.
         """
-        results: list[tuple[int, DetectionResult]] = []
+        best: DetectionResult | None = None
 
         for detector in self.detectors:
             result = detector.detect(file)
-            if result is not None:
-                results.append((detector.priority, result))
-
-        if not results:
+            if result is None:
+                continue
+            if result.confidence >= CONFIDENCE_HIGH:
+                return result
+            # Strict comparison keeps the earlier (more specific) detector on ties
+            if best is None or result.confidence > best.confidence:
+                best = result
+
+        if best is None:
             # No detector matched
             return DetectionResult(
                 category="Unsorted",
@@ -65,10 +72,7 @@ class DetectorRegistry:
                 reason="No detector matched this file",
             )
 
-        # Sort by confidence (desc), then by priority (asc) for tie-breaking
-        results.sort(key=lambda x: (-x[1].confidence, x[0]))
-
-        return results[0][1]
+        return best
 
 
 # Global registry instance
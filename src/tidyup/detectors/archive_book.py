@@ -50,13 +50,14 @@ MODERATE_BOOK_KEYWORDS = [
     r"\banalyst\b",
     r"\bdeveloper\b",
     r"\bin\s+action\b",       # "Spring in Action"
-    r"\bpro\s+\w+",           # "Pro Git"
+    r"\bpro\s+(?=\w)",        # "Pro Git" (lookahead keeps the next word scannable)
     r"\bhead\s+first\b",      # "Head First Java"
 ]
 
-# Compile patterns
-STRONG_PATTERNS = [re.compile(p, re.IGNORECASE) for p in STRONG_BOOK_KEYWORDS]
-MODERATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in MODERATE_BOOK_KEYWORDS]
+# Compile each group into one alternation. Moderate keywords are wrapped in
+# capturing groups so ``lastindex`` tells which keyword a match came from.
+STRONG_RE = re.compile("|".join(f"(?:{p})" for p in STRONG_BOOK_KEYWORDS), re.IGNORECASE)
+MODERATE_RE = re.compile("|".join(f"({p})" for p in MODERATE_BOOK_KEYWORDS), re.IGNORECASE)
 
 
 class ArchiveBookDetector(BaseDetector):
@@ -83,7 +84,7 @@ class ArchiveBookDetector(BaseDetector):
             DetectionResult if archive appears to contain books,
             None otherwise.
         """
-        ext = file.extension.lower()
+        ext = file.extension
 
         # Try to inspect ZIP-compatible archives
         if ext in ZIP_COMPATIBLE:
@@ -102,45 +103,45 @@ class ArchiveBookDetector(BaseDetector):
     def _inspect_zip(self, file: FileInfo) -> DetectionResult | None:
         """Inspect ZIP archive contents for book files."""
         try:
+            # infolist() hands back the parsed central directory as-is;
+            # namelist() would build a second list just to hold the names.
+            # The archive is closed before scanning; only metadata is needed.
             with zipfile.ZipFile(file.path, "r") as zf:
-                names = zf.namelist()
-
-                # Count book files inside
-                book_files = [
-                    n for n in names
-                    if any(n.lower().endswith(ext) for ext in BOOK_EXTENSIONS)
-                ]
-
-                if book_files:
-                    # Found book files inside
-                    ext_found = set()
-                    for name in book_files:
-                        for ext in BOOK_EXTENSIONS:
-                            if name.lower().endswith(ext):
-                                ext_found.add(ext.lstrip("."))
-                                break
-
-                    return DetectionResult(
-                        category="Books",
-                        confidence=CONFIDENCE_HIGH,
-                        detector_name=self.name,
-                        reason=f"Contains {len(book_files)} book file(s) ({', '.join(ext_found)})",
-                    )
-
+                infos = zf.infolist()
         except (zipfile.BadZipFile, OSError, PermissionError):
             # Not a valid ZIP or can't read it
-            pass
+            return None
+
+        # Count book files inside, keyed on the lowercased suffix
+        book_count = 0
+        ext_found = set()
+        for info in infos:
+            name = info.filename
+            dot = name.rfind(".")
+            if dot < 0:
+                continue
+            suffix = name[dot:].lower()
+            if suffix in BOOK_EXTENSIONS:
+                book_count += 1
+                ext_found.add(suffix[1:])
+
+        if book_count:
+            return DetectionResult(
+                category="Books",
+                confidence=CONFIDENCE_HIGH,
+                detector_name=self.name,
+                reason=f"Contains {book_count} book file(s) ({', '.join(ext_found)})",
+            )
 
         return None
 
     def _analyze_filename(self, file: FileInfo) -> DetectionResult | None:
         """Analyze filename for book-related keywords."""
         # Get stem without extension
-        stem = file.path.stem.lower()
+        stem = file.stem.lower()
 
         # Check for strong indicators (single match = high confidence)
-        strong_matches = sum(1 for p in STRONG_PATTERNS if p.search(stem))
-        if strong_matches >= 1:
+        if STRONG_RE.search(stem):
             return DetectionResult(
                 category="Books",
                 confidence=CONFIDENCE_HIGH,
@@ -149,7 +150,7 @@ class ArchiveBookDetector(BaseDetector):
             )
 
         # Check moderate indicators (need 2+ matches)
-        moderate_matches = sum(1 for p in MODERATE_PATTERNS if p.search(stem))
+        moderate_matches = len({m.lastindex for m in MODERATE_RE.finditer(stem)})
         if moderate_matches >= 2:
             return DetectionResult(
                 category="Books",
@@ -10,7 +10,10 @@ from .base import CONFIDENCE_HIGH, BaseDetector
 
 # arXiv filename pattern: YYMM.NNNNN or YYMM.NNNNNvN
 # Examples: 2501.12948.pdf, 2501.12948v1.pdf, 2501.12948v2.pdf
-ARXIV_PATTERN = re.compile(r"^\d{4}\.\d{4,5}(v\d+)?$")
+ARXIV_PATTERN = re.compile(r"\d{4}\.\d{4,5}(?:v\d+)?")
+
+# Shortest possible arXiv stem: YYMM.NNNN
+_MIN_STEM_LENGTH = 9
 
 
 class ArxivDetector(BaseDetector):
@@ -37,13 +40,17 @@ class ArxivDetector(BaseDetector):
             None otherwise.
         """
         # Must be a PDF
-        if file.extension.lower() != "pdf":
+        if file.extension != "pdf":
             return None
 
-        # Check filename pattern
-        stem = file.path.stem
+        # Check filename pattern; the extension is "pdf", so drop ".pdf"
+        stem = file.name[:-4]
+
+        # Cheap shape check before running the regex
+        if len(stem) < _MIN_STEM_LENGTH or stem[4] != ".":
+            return None
 
-        if ARXIV_PATTERN.match(stem):
+        if ARXIV_PATTERN.fullmatch(stem):
             return DetectionResult(
                 category="Papers",
                 confidence=CONFIDENCE_HIGH,
@@ -7,7 +7,7 @@ import re
 
 from ..models import DetectionResult, FileInfo
 from .base import CONFIDENCE_HIGH, CONFIDENCE_MEDIUM, BaseDetector
-from .content import extract_pdf_text_cached
+from .content import compile_keywords, count_keywords, extract_pdf_text_cached
 
 # Book file extensions (handled by GenericDetector, but we boost priority for PDFs)
 EBOOK_EXTENSIONS = {"epub", "mobi", "azw", "azw3", "fb2"}
@@ -36,8 +36,8 @@ BOOK_KEYWORDS = [
     r"\bprinted\s+in\b",
 ]
 
-# Compile patterns
-BOOK_PATTERNS = [re.compile(p, re.IGNORECASE) for p in BOOK_KEYWORDS]
+# All keywords in one alternation, so the text is scanned once
+BOOK_RE = compile_keywords(BOOK_KEYWORDS)
 
 
 class BookDetector(BaseDetector):
@@ -65,7 +65,7 @@ class BookDetector(BaseDetector):
             DetectionResult if file appears to be a book,
             None otherwise.
         """
-        ext = file.extension.lower()
+        ext = file.extension
 
         # Ebook extensions are definitely books
         if ext in EBOOK_EXTENSIONS:
@@ -94,7 +94,7 @@ class BookDetector(BaseDetector):
             )
 
         # Count keyword matches
-        match_count = sum(1 for p in BOOK_PATTERNS if p.search(text))
+        match_count = count_keywords(BOOK_RE, BOOK_KEYWORDS, text)
 
         if match_count >= 4:
             # Many book keywords = high confidence
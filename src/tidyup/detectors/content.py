@@ -5,14 +5,26 @@ various file types to enable content-based detection.
 """
 
 import logging
+import re
+from collections.abc import Sequence
 from functools import lru_cache
 from pathlib import Path
 
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError
 
+# PyMuPDF is an optional, much faster text extractor (pip install tidyup[pdf]).
+# It is AGPL-licensed, so it stays opt-in; pypdf remains the default backend.
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
 # Suppress noisy pypdf warnings for malformed PDFs
 logging.getLogger("pypdf").setLevel(logging.ERROR)
+if pymupdf is not None:
+    # Same for MuPDF, which otherwise prints repair warnings to stderr
+    pymupdf.TOOLS.mupdf_display_errors(False)
 
 
 def extract_pdf_text(
@@ -29,17 +41,59 @@ def extract_pdf_text(
 
     Returns:
         Extracted text, or None if extraction fails.
+
+    Note:
+        Uses PyMuPDF when it is installed and pypdf otherwise.
     """
     try:
-        reader = PdfReader(path)
-        text_parts: list[str] = []
-        total_chars = 0
+        if pymupdf is not None:
+            text_parts = _extract_pages_pymupdf(path, max_pages, max_chars)
+        else:
+            text_parts = _extract_pages_pypdf(path, max_pages, max_chars)
+
+        if not text_parts:
+            return None
+
+        full_text = "\n".join(text_parts)
+        return full_text[:max_chars] if len(full_text) > max_chars else full_text
+
+    except (PdfReadError, Exception):
+        # PDF is corrupted, encrypted, or otherwise unreadable
+        return None
 
-        for i, page in enumerate(reader.pages):
+
+def _extract_pages_pypdf(path: Path, max_pages: int, max_chars: int) -> list[str]:
+    """Collect non-empty page texts with pypdf until either limit is hit."""
+    reader = PdfReader(path)
+    text_parts: list[str] = []
+    total_chars = 0
+
+    for i, page in enumerate(reader.pages):
+        if i >= max_pages:
+            break
+
+        page_text = page.extract_text()
+        if page_text:
+            text_parts.append(page_text)
+            total_chars += len(page_text)
+
+            if total_chars >= max_chars:
+                break
+
+    return text_parts
+
+
+def _extract_pages_pymupdf(path: Path, max_pages: int, max_chars: int) -> list[str]:
+    """Collect non-empty page texts with PyMuPDF until either limit is hit."""
+    text_parts: list[str] = []
+    total_chars = 0
+
+    with pymupdf.open(path) as doc:
+        for i, page in enumerate(doc):
             if i >= max_pages:
                 break
 
-            page_text = page.extract_text()
+            page_text = page.get_text("text")
             if page_text:
                 text_parts.append(page_text)
                 total_chars += len(page_text)
@@ -47,15 +101,7 @@ def extract_pdf_text(
                 if total_chars >= max_chars:
                     break
 
-        if not text_parts:
-            return None
-
-        full_text = "\n".join(text_parts)
-        return full_text[:max_chars] if len(full_text) > max_chars else full_text
-
-    except (PdfReadError, Exception):
-        # PDF is corrupted, encrypted, or otherwise unreadable
-        return None
+    return text_parts
 
 
 @lru_cache(maxsize=128)
@@ -77,3 +123,40 @@ def extract_pdf_text_cached(
         Extracted text, or None if extraction fails.
     """
     return extract_pdf_text(Path(path), max_pages, max_chars)
+
+
+def compile_keywords(keywords: Sequence[str]) -> re.Pattern[str]:
+    """Compile word-boundary keyword patterns into one case-insensitive regex.
+
+    Every keyword must start with ``\\b``. The boundary is factored out of
+    the alternation so it is tested once per position instead of once per
+    keyword, and keyword ``i`` is wrapped in a group named ``k<i>``.
+
+    Args:
+        keywords: Regex sources, each starting with ``\\b``.
+
+    Returns:
+        Compiled alternation for use with `matched_keywords`.
+    """
+    if not all(k.startswith(r"\b") for k in keywords):
+        raise ValueError("keyword patterns must start with \\b")
+    body = "|".join(f"(?P<k{i}>{k[2:]})" for i, k in enumerate(keywords))
+    return re.compile(rf"\b(?:{body})", re.IGNORECASE)
+
+
+def matched_keywords(pattern: re.Pattern[str], keywords: Sequence[str], text: str) -> set[str]:
+    """Return the keyword sources from `compile_keywords` that occur in text.
+
+    The text is scanned once; the set holds each matching keyword source.
+    """
+    return {keywords[int(m.lastgroup[1:])] for m in pattern.finditer(text) if m.lastgroup}
+
+
+def count_keywords(pattern: re.Pattern[str], keywords: Sequence[str], text: str) -> int:
+    """Count the entries of keywords that occur in text.
+
+    Same result as ``sum(1 for k in keywords if re.search(k, text, re.I))``,
+    including a keyword listed twice counting twice, from a single scan.
+    """
+    found = matched_keywords(pattern, keywords, text)
+    return sum(1 for k in keywords if k in found)
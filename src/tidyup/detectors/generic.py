@@ -128,7 +128,7 @@ class GenericDetector(BaseDetector):
         Returns:
             DetectionResult if extension is recognized, None otherwise.
         """
-        ext = file.extension.lower()
+        ext = file.extension
 
         if ext in EXTENSION_MAP:
             category, confidence = EXTENSION_MAP[ext]
@@ -49,7 +49,7 @@ class InstallerDetector(BaseDetector):
             DetectionResult if file is an installer,
             None otherwise.
         """
-        ext = file.extension.lower()
+        ext = file.extension
 
         if ext in INSTALLER_EXTENSIONS:
             return DetectionResult(
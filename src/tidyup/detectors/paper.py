@@ -7,7 +7,7 @@ import re
 
 from ..models import DetectionResult, FileInfo
 from .base import CONFIDENCE_HIGH, CONFIDENCE_MEDIUM, BaseDetector
-from .content import extract_pdf_text_cached
+from .content import compile_keywords, extract_pdf_text_cached, matched_keywords
 
 # DOI patterns
 DOI_PATTERN = re.compile(r"\b10\.\d{4,}/[^\s]+\b")
@@ -43,14 +43,15 @@ PAPER_KEYWORDS = [
     r"\bdepartment\s+of\b",
 ]
 
-# Compile patterns
-PAPER_PATTERNS = [re.compile(p, re.IGNORECASE) for p in PAPER_KEYWORDS]
+# All keywords in one alternation, so the text is scanned once
+PAPER_RE = compile_keywords(PAPER_KEYWORDS)
 
-# Strong academic indicators (just 1-2 of these = high confidence)
+# Strong academic indicators (just 1-2 of these = high confidence).
+# Each is also a paper keyword, so they are read off the same scan.
 STRONG_INDICATORS = [
-    re.compile(r"\babstract\b", re.IGNORECASE),
-    re.compile(r"\breferences\b", re.IGNORECASE),
-    re.compile(r"\bet\s+al\.?\b", re.IGNORECASE),
+    r"\babstract\b",
+    r"\breferences\b",
+    r"\bet\s+al\.?\b",
 ]
 
 
@@ -79,7 +80,7 @@ class PaperDetector(BaseDetector):
             DetectionResult if file appears to be an academic paper,
             None otherwise.
         """
-        ext = file.extension.lower()
+        ext = file.extension
 
         # Only handle PDFs
         if ext != "pdf":
@@ -98,11 +99,13 @@ class PaperDetector(BaseDetector):
                 reason="Contains DOI",
             )
 
+        found = matched_keywords(PAPER_RE, PAPER_KEYWORDS, text)
+
         # Count strong indicator matches
-        strong_matches = sum(1 for p in STRONG_INDICATORS if p.search(text))
+        strong_matches = sum(1 for p in STRONG_INDICATORS if p in found)
 
         # Count all keyword matches
-        match_count = sum(1 for p in PAPER_PATTERNS if p.search(text))
+        match_count = len(found)
 
         # Strong indicators + good keyword count = high confidence
         if strong_matches >= 2 and match_count >= 5:
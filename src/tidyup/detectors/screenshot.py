@@ -76,11 +76,11 @@ class ScreenshotDetector(BaseDetector):
             None otherwise.
         """
         # Must be an image extension
-        if file.extension.lower() not in SCREENSHOT_EXTENSIONS:
+        if file.extension not in SCREENSHOT_EXTENSIONS:
             return None
 
         # Check filename against patterns
-        stem = file.path.stem
+        stem = file.stem
 
         for pattern in COMPILED_PATTERNS:
             if pattern.match(stem):
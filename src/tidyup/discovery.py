@@ -5,7 +5,12 @@ filtering by patterns, hidden files, and recency.
 """
 
 import fnmatch
+import functools
+import heapq
+import os
+import re
 from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -26,6 +31,70 @@ DEFAULT_SKIP_PATTERNS = [
 ]
 
 
+def _normalize_patterns(patterns: list[str]) -> tuple[str, ...]:
+    """Lowercase and de-duplicate glob patterns, preserving order."""
+    return tuple(dict.fromkeys(p.lower() for p in patterns))
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class _SkipMatcher:
+    """Precompiled form of a set of lowercased skip patterns.
+
+    Patterns are split into exact names, simple ``*.ext``-style suffixes,
+    and a regex for everything else, so most checks are a set lookup or
+    a single str.endswith call.
+
+    Attributes:
+        literals: Patterns without glob characters.
+        suffixes: Suffixes of patterns of the form ``*<literal>``.
+        rest: Combined regex for the remaining patterns, if any.
+    """
+
+    literals: frozenset[str]
+    suffixes: tuple[str, ...]
+    rest: re.Pattern[str] | None
+
+    def matches(self, name_lower: str) -> bool:
+        """Check if a lowercased filename matches any pattern."""
+        return (
+            name_lower in self.literals
+            or name_lower.endswith(self.suffixes)
+            or (self.rest is not None and self.rest.match(name_lower) is not None)
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_skip_patterns(patterns: tuple[str, ...]) -> _SkipMatcher:
+    """Compile lowercased glob patterns into a _SkipMatcher.
+
+    Args:
+        patterns: Lowercased glob patterns to combine
+            (see _normalize_patterns). Match against lowercased names.
+
+    Returns:
+        Matcher covering all patterns.
+    """
+    literals: set[str] = set()
+    suffixes: list[str] = []
+    others: list[str] = []
+    for pattern in patterns:
+        if _GLOB_CHARS.isdisjoint(pattern):
+            literals.add(pattern)
+        elif pattern.startswith("*") and _GLOB_CHARS.isdisjoint(pattern[1:]):
+            suffixes.append(pattern[1:])
+        else:
+            others.append(pattern)
+
+    rest = None
+    if others:
+        rest = re.compile("(?:" + "|".join(fnmatch.translate(p) for p in others) + ")")
+
+    return _SkipMatcher(frozenset(literals), tuple(suffixes), rest)
+
+
 def should_skip_pattern(name: str, patterns: list[str]) -> bool:
     """Check if filename matches any skip pattern.
 
@@ -36,11 +105,7 @@ def should_skip_pattern(name: str, patterns: list[str]) -> bool:
     Returns:
         True if the file should be skipped.
     """
-    name_lower = name.lower()
-    for pattern in patterns:
-        if fnmatch.fnmatch(name_lower, pattern.lower()):
-            return True
-    return False
+    return _compile_skip_patterns(_normalize_patterns(patterns)).matches(name.lower())
 
 
 def should_skip_recent(
@@ -62,6 +127,28 @@ def should_skip_recent(
     return modified > cutoff
 
 
+def _in_name_order(
+    entries: list[os.DirEntry], limit: int | None
+) -> Iterator[os.DirEntry]:
+    """Yield directory entries sorted by name.
+
+    Without a limit the whole list is sorted. With a limit, entries are
+    heapified (O(n)) and popped lazily, so only as many as the caller
+    consumes are ordered; later filtering can still pull more than
+    `limit` entries without losing the sorted order.
+    """
+    if limit is None:
+        entries.sort(key=lambda e: e.name)
+        yield from entries
+        return
+
+    # Names are unique within a directory, so entries are never compared
+    heap = [(entry.name, entry) for entry in entries]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[1]
+
+
 def discover_files(
     source: Path,
     skip_patterns: list[str] | None = None,
@@ -98,34 +185,47 @@ def discover_files(
     all_patterns = DEFAULT_SKIP_PATTERNS.copy()
     if skip_patterns:
         all_patterns.extend(skip_patterns)
+    skip_matcher = _compile_skip_patterns(_normalize_patterns(all_patterns))
 
-    count = 0
+    # Compute the recency cutoff once per run, as an epoch timestamp
+    cutoff: float | None = None
+    if skip_recent_hours > 0:
+        cutoff = (datetime.now() - timedelta(hours=skip_recent_hours)).timestamp()
 
-    # Use iterdir for non-recursive, shallow scan of source
-    for path in sorted(source.iterdir()):
-        # Skip directories
-        if path.is_dir():
-            continue
+    # Single scandir pass, cheapest checks first: name-only filters run
+    # before the type check, and only survivors are ever stat'ed
+    candidates: list[os.DirEntry] = []
+    with os.scandir(source) as it:
+        for entry in it:
+            name = entry.name
 
-        # Skip hidden files
-        if skip_hidden and path.name.startswith("."):
-            continue
+            # Skip hidden files
+            if skip_hidden and name.startswith("."):
+                continue
 
-        # Skip by pattern
-        if should_skip_pattern(path.name, all_patterns):
-            continue
+            # Skip by pattern
+            if skip_matcher.matches(name.lower()):
+                continue
+
+            # Skip directories (uses the cached d_type for non-symlinks)
+            if entry.is_dir():
+                continue
 
-        # Create FileInfo to get modification time
+            candidates.append(entry)
+
+    count = 0
+
+    for entry in _in_name_order(candidates, limit):
         try:
-            file_info = FileInfo.from_path(path)
+            # Skip recent files (entry.stat() is cached for from_dirent)
+            if cutoff is not None and entry.stat().st_mtime > cutoff:
+                continue
+
+            file_info = FileInfo.from_dirent(entry)
         except (OSError, PermissionError):
             # Skip files we can't access
             continue
 
-        # Skip recent files
-        if should_skip_recent(file_info.modified, skip_recent_hours):
-            continue
-
         yield file_info
         count += 1
 
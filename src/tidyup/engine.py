@@ -10,7 +10,14 @@ from .categories import get_category_manager
 from .detectors import get_registry
 from .discovery import discover_files
 from .logger import ActionLogger
-from .models import Action, DetectionResult, FileInfo, RenameResult, RunResult
+from .models import (
+    DEFAULT_CONFIDENCE_THRESHOLD,
+    Action,
+    DetectionResult,
+    FileInfo,
+    RenameResult,
+    RunResult,
+)
 from .operations import (
     ensure_dest_structure,
     get_default_folders,
@@ -66,7 +73,10 @@ class Engine:
         self.verbose = self.options.get("verbose", False)
         self.limit = self.options.get("limit")
 
-        self.confidence_threshold = 0.7
+        self.confidence_threshold = DEFAULT_CONFIDENCE_THRESHOLD
+
+        # Category -> folder name, resolved once per category per run
+        self._folder_names: dict[str, str] = {}
 
         # Initialize interactive handler if needed
         self._interactive_handler = None
@@ -102,12 +112,18 @@ class Engine:
         Returns:
             Folder name (e.g., "01_Documents", "02_Screenshots").
         """
+        folder_name = self._folder_names.get(category)
+        if folder_name is not None:
+            return folder_name
+
         manager = get_category_manager()
         try:
-            return manager.get_folder_name(category)
+            folder_name = manager.get_folder_name(category)
         except ValueError:
             # Unknown category falls back to Unsorted
-            return manager.get_folder_name("Unsorted")
+            folder_name = manager.get_folder_name("Unsorted")
+        self._folder_names[category] = folder_name
+        return folder_name
 
     def generate_new_name(self, file: FileInfo, detection: DetectionResult) -> RenameResult | None:
         """Generate a new filename for a file.
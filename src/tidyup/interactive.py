@@ -29,7 +29,7 @@ class InteractiveHandler:
         """
         if detection.category in self.skip_categories:
             return False
-        if file.extension.lower() in self.skip_extensions:
+        if file.extension in self.skip_extensions:
             return False
         return True
 
@@ -81,7 +81,7 @@ class InteractiveHandler:
         elif choice == "n":
             return ("skip", None)
         elif choice == "s":
-            self.skip_extensions.add(file.extension.lower())
+            self.skip_extensions.add(file.extension)
             return ("skip_type", None)
         elif choice == "c":
             return self._prompt_category_change()
@@ -5,15 +5,36 @@ for auditing and status reporting.
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from .models import Action, RunResult, RunSummary
 
+# orjson is an optional speedup for writing/reading logs (pip install tidyup[fast])
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Per-run summaries are mirrored into this subdirectory of the log dir so
+# status reporting can read a few bytes instead of the whole action log
+SUMMARY_DIR_NAME = "summaries"
+
+# Below this many logs, reading serially beats starting a thread pool
+PARALLEL_LOG_THRESHOLD = 8
+
+
+# Log directories already created in this process (mkdir runs once per path)
+_ensured_log_dirs: set[Path] = set()
+
 
 def get_tidy_dir() -> Path:
     """Get the tidy config/data directory.
 
+    Resolved on every call so a changed HOME (e.g. in tests) is honoured.
+
     Returns:
         Path to ~/.tidy/ directory.
     """
@@ -23,13 +44,17 @@ def get_tidy_dir() -> Path:
 def ensure_log_dir() -> Path:
     """Ensure the log directory exists.
 
-    Creates ~/.tidy/logs/ if it doesn't exist.
+    Creates ~/.tidy/logs/ and its summaries/ subdirectory if they don't
+    exist. The mkdirs only run the first time a given log directory is
+    requested in a process.
 
     Returns:
         Path to the logs directory.
     """
     log_dir = get_tidy_dir() / "logs"
-    log_dir.mkdir(parents=True, exist_ok=True)
+    if log_dir not in _ensured_log_dirs:
+        (log_dir / SUMMARY_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        _ensured_log_dirs.add(log_dir)
     return log_dir
 
 
@@ -122,14 +147,86 @@ class ActionLogger:
         log_path = log_dir / filename
 
         run_result = self.get_run_result()
-        log_data = run_result.to_dict()
+        _write_run_log(log_path, run_result)
 
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
+        # Write the summary sidecar used by aggregate_logs
+        _write_json(log_dir / SUMMARY_DIR_NAME / filename, run_result.summary.to_dict())
 
         return log_path
 
 
+def _write_run_log(path: Path, run_result: RunResult) -> None:
+    """Write a run log, streaming actions to disk one at a time.
+
+    The output is identical to dumping RunResult.to_dict() with an indent
+    of 2, but only one action dict exists in memory at any point.
+    """
+    header = {
+        "timestamp": run_result.timestamp.isoformat(),
+        "source": str(run_result.source),
+        "destination": str(run_result.destination),
+        "options": run_result.options,
+    }
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for key, value in header.items():
+            f.write(f'  "{key}": {_dumps_indented(value, level=1)},\n')
+
+        f.write('  "actions": [')
+        for i, action in enumerate(run_result.actions):
+            f.write(",\n    " if i else "\n    ")
+            f.write(_dumps_indented(action.to_dict(), level=2))
+        f.write("\n  ],\n" if run_result.actions else "],\n")
+
+        summary = _dumps_indented(run_result.summary.to_dict(), level=1)
+        f.write(f'  "summary": {summary}\n}}')
+
+
+def _dumps_indented(data: object, level: int) -> str:
+    """Serialize data with an indent of 2, nested `level` levels deep."""
+    if orjson is not None:
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    else:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    return text.replace("\n", "\n" + "  " * level)
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write data as compact UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+
+def _read_json(path: Path) -> dict:
+    """Read a JSON file, using orjson when available."""
+    data: dict
+    if orjson is not None:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    return data
+
+
+def _parse_summary(summary_data: dict) -> RunSummary:
+    """Build a RunSummary from its serialized dict form."""
+    return RunSummary(
+        processed=summary_data.get("processed", 0),
+        moved=summary_data.get("moved", 0),
+        renamed=summary_data.get("renamed", 0),
+        unsorted=summary_data.get("unsorted", 0),
+        skipped=summary_data.get("skipped", 0),
+        errors=summary_data.get("errors", 0),
+        duplicates=summary_data.get("duplicates", 0),
+    )
+
+
 def load_log(path: Path) -> RunResult:
     """Load a log file and parse it back to a RunResult.
 
@@ -143,20 +240,10 @@ def load_log(path: Path) -> RunResult:
         FileNotFoundError: If log file doesn't exist.
         json.JSONDecodeError: If log file is invalid JSON.
     """
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(path)
 
     # Parse the summary
-    summary_data = data.get("summary", {})
-    summary = RunSummary(
-        processed=summary_data.get("processed", 0),
-        moved=summary_data.get("moved", 0),
-        renamed=summary_data.get("renamed", 0),
-        unsorted=summary_data.get("unsorted", 0),
-        skipped=summary_data.get("skipped", 0),
-        errors=summary_data.get("errors", 0),
-        duplicates=summary_data.get("duplicates", 0),
-    )
+    summary = _parse_summary(data.get("summary", {}))
 
     # Note: We don't fully parse actions back to Action objects
     # as that would require reconstructing FileInfo, DetectionResult etc.
@@ -172,6 +259,33 @@ def load_log(path: Path) -> RunResult:
     )
 
 
+def load_summary(path: Path) -> RunSummary:
+    """Load only the summary of a run.
+
+    Reads the small summary sidecar written alongside the log, falling
+    back to parsing the full log for logs saved without one or whose
+    sidecar is unreadable.
+
+    Args:
+        path: Path to the log file.
+
+    Returns:
+        RunSummary for the run.
+
+    Raises:
+        FileNotFoundError: If log file doesn't exist.
+        json.JSONDecodeError: If the summary or log file is invalid JSON.
+    """
+    try:
+        summary_data = _read_json(path.parent / SUMMARY_DIR_NAME / path.name)
+    except (OSError, ValueError):
+        # Missing, truncated or corrupt sidecar; the log itself may be fine
+        return load_log(path).summary
+    if not isinstance(summary_data, dict):
+        return load_log(path).summary
+    return _parse_summary(summary_data)
+
+
 def list_logs(limit: int | None = None) -> list[Path]:
     """List log files sorted by date descending (newest first).
 
@@ -238,22 +352,46 @@ def aggregate_logs(days: int = 7) -> dict:
         "total_duplicates": 0,
     }
 
-    for log_path in log_dir.glob("*.json"):
-        # Check if log is within date range (filename format: YYYY-MM-DD_HHMMSS.json)
-        log_date = log_path.stem[:10]  # Extract YYYY-MM-DD
-        if log_date < cutoff_str:
-            continue
+    # Filenames (YYYY-MM-DD_HHMMSS.json) sort chronologically, so walk them
+    # newest first and stop at the first one older than the cutoff
+    with os.scandir(log_dir) as it:
+        names = sorted(
+            (e.name for e in it if e.name.endswith(".json") and e.is_file()),
+            reverse=True,
+        )
 
-        try:
-            run_result = load_log(log_path)
-            stats["total_runs"] += 1
-            stats["total_processed"] += run_result.summary.processed
-            stats["total_moved"] += run_result.summary.moved
-            stats["total_renamed"] += run_result.summary.renamed
-            stats["total_errors"] += run_result.summary.errors
-            stats["total_duplicates"] += run_result.summary.duplicates
-        except (json.JSONDecodeError, KeyError, ValueError):
+    in_range: list[Path] = []
+    for name in names:
+        if name[:10] < cutoff_str:
+            break
+        in_range.append(log_dir / name)
+
+    # Reading logs is I/O bound, so threads overlap the reads
+    if len(in_range) > PARALLEL_LOG_THRESHOLD:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            summaries = list(executor.map(_try_load_summary, in_range))
+    else:
+        summaries = [_try_load_summary(path) for path in in_range]
+
+    for summary in summaries:
+        if summary is None:
             # Skip invalid log files
             continue
 
+        stats["total_runs"] += 1
+        stats["total_processed"] += summary.processed
+        stats["total_moved"] += summary.moved
+        stats["total_renamed"] += summary.renamed
+        stats["total_errors"] += summary.errors
+        stats["total_duplicates"] += summary.duplicates
+
     return stats
+
+
+def _try_load_summary(path: Path) -> RunSummary | None:
+    """Load a run summary, returning None if the log is invalid."""
+    try:
+        return load_summary(path)
+    except (json.JSONDecodeError, KeyError, ValueError):
+        return None
@@ -4,31 +4,69 @@ This module contains all the dataclasses used throughout the application
 for representing files, detection results, actions, and run summaries.
 """
 
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
 from typing import Literal
 
 
-@dataclass
+def _extension(name: str) -> str:
+    """Return the lowercase extension of a filename, without the dot.
+
+    Matches Path.suffix: leading-dot names like ".bashrc" and names
+    ending in a dot have no extension.
+    """
+    if "." not in name[1:]:
+        return ""
+    return name.rpartition(".")[2].lower()
+
+
+@dataclass(slots=True)
 class FileInfo:
     """Information about a file to be processed.
 
+    Timestamps are stored as raw epoch seconds and only converted to
+    datetime objects when accessed through `modified` / `created`.
+
     Attributes:
         path: Full path to the file.
         name: Filename without path.
         extension: File extension without dot (lowercase).
         size: File size in bytes.
-        modified: Last modification timestamp.
-        created: Creation timestamp.
+        mtime: Last modification time (epoch seconds).
+        ctime: Creation time (epoch seconds).
     """
 
     path: Path
     name: str
     extension: str
     size: int
-    modified: datetime
-    created: datetime
+    mtime: float
+    ctime: float
+
+    @property
+    def stem(self) -> str:
+        """Filename without its extension, matching ``Path.stem``.
+
+        Sliced straight from `name`, so detectors and renamers avoid
+        re-parsing the full path on every call.
+        """
+        name = self.name
+        dot = name.rfind(".")
+        if 0 < dot < len(name) - 1:
+            return name[:dot]
+        return name
+
+    @property
+    def modified(self) -> datetime:
+        """Last modification timestamp."""
+        return datetime.fromtimestamp(self.mtime)
+
+    @property
+    def created(self) -> datetime:
+        """Creation timestamp."""
+        return datetime.fromtimestamp(self.ctime)
 
     @classmethod
     def from_path(cls, path: Path) -> "FileInfo":
@@ -37,10 +75,28 @@ class FileInfo:
         return cls(
             path=path,
             name=path.name,
-            extension=path.suffix.lstrip(".").lower() if path.suffix else "",
+            extension=_extension(path.name),
             size=stat.st_size,
-            modified=datetime.fromtimestamp(stat.st_mtime),
-            created=datetime.fromtimestamp(stat.st_ctime),
+            mtime=stat.st_mtime,
+            ctime=stat.st_ctime,
+        )
+
+    @classmethod
+    def from_dirent(cls, entry: os.DirEntry) -> "FileInfo":
+        """Create a FileInfo from an os.scandir() entry.
+
+        Reuses the entry's cached stat result, so building a FileInfo
+        costs at most one stat call per file.
+        """
+        path = Path(entry.path)
+        stat = entry.stat()
+        return cls(
+            path=path,
+            name=entry.name,
+            extension=_extension(entry.name),
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            ctime=stat.st_ctime,
         )
 
     def to_dict(self) -> dict:
@@ -55,7 +111,11 @@ class FileInfo:
         }
 
 
-@dataclass
+# Default confidence threshold for a detection to count as certain
+DEFAULT_CONFIDENCE_THRESHOLD = 0.7
+
+
+@dataclass(slots=True)
 class DetectionResult:
     """Result of file type detection.
 
@@ -71,7 +131,7 @@ class DetectionResult:
     detector_name: str
     reason: str | None = None
 
-    def is_confident(self, threshold: float = 0.7) -> bool:
+    def is_confident(self, threshold: float = DEFAULT_CONFIDENCE_THRESHOLD) -> bool:
         """Check if detection meets confidence threshold."""
         return self.confidence >= threshold
 
@@ -87,7 +147,7 @@ class DetectionResult:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class RenameResult:
     """Result of file renaming.
 
@@ -122,7 +182,7 @@ class RenameResult:
 ActionStatus = Literal["pending", "success", "error", "skipped"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """A single file processing action.
 
@@ -164,7 +224,7 @@ class Action:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class RunSummary:
     """Summary statistics for a run.
 
@@ -188,10 +248,18 @@ class RunSummary:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "processed": self.processed,
+            "moved": self.moved,
+            "renamed": self.renamed,
+            "unsorted": self.unsorted,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "duplicates": self.duplicates,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Complete result of a tidy run.
 
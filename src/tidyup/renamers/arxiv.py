@@ -47,7 +47,7 @@ class ArxivRenamer(BaseRenamer):
             return None
 
         # Extract arXiv ID from filename
-        match = ARXIV_ID_PATTERN.search(file.path.stem)
+        match = ARXIV_ID_PATTERN.search(file.stem)
         if not match:
             return None
 
@@ -79,4 +79,4 @@ class BaseRenamer(ABC):
             True if file should be renamed.
         """
         from ..utils import is_ugly_filename
-        return is_ugly_filename(file.path.stem)
+        return is_ugly_filename(file.stem)
@@ -41,7 +41,7 @@ class BookRenamer(BaseRenamer):
         Returns:
             RenameResult if file should be renamed, None otherwise.
         """
-        ext = file.extension.lower()
+        ext = file.extension
 
         # Extract metadata based on file type
         metadata = None
@@ -210,7 +210,7 @@ class BookRenamer(BaseRenamer):
 
     def _extract_from_filename(self, file: FileInfo) -> dict | None:
         """Extract metadata from filename patterns."""
-        stem = file.path.stem
+        stem = file.stem
 
         # Try to find year in filename
         year_match = re.search(r"\b(19|20)\d{2}\b", stem)
@@ -39,7 +39,7 @@ class GenericRenamer(BaseRenamer):
         if not self.should_rename(file):
             return None
 
-        stem = file.path.stem
+        stem = file.stem
         ext = file.extension
 
         # Generate new name based on date and sanitized name
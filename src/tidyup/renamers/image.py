@@ -83,7 +83,7 @@ class ImageRenamer(BaseRenamer):
         if not self.should_rename(file):
             return None
 
-        ext = file.extension.lower()
+        ext = file.extension
 
         # Try to extract EXIF date for supported formats
         exif_date = None
@@ -99,7 +99,7 @@ class ImageRenamer(BaseRenamer):
             date_extracted = file.modified.date()
 
         # Build new filename
-        sanitized_name = sanitize_filename(file.path.stem)
+        sanitized_name = sanitize_filename(file.stem)
         if len(sanitized_name) < 3:
             new_stem = f"{date_str}_image"
         else:
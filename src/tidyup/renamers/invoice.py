@@ -76,7 +76,7 @@ class InvoiceRenamer(BaseRenamer):
         if detection.detector_name != "InvoiceDetector":
             return None
 
-        if file.extension.lower() != "pdf":
+        if file.extension != "pdf":
             return None
 
         # Try to extract vendor from text
@@ -39,7 +39,7 @@ def extract_pdf_metadata(file: FileInfo) -> tuple[str | None, datetime | None]:
         if metadata.title:
             title = str(metadata.title).strip()
             # Skip if title is just the filename or too short
-            if len(title) < 3 or title.lower() == file.path.stem.lower():
+            if len(title) < 3 or title.lower() == file.stem.lower():
                 title = None
 
         # Extract creation date
@@ -122,7 +122,7 @@ class PDFRenamer(BaseRenamer):
         if not self.should_rename(file):
             return None
 
-        if file.extension.lower() != "pdf":
+        if file.extension != "pdf":
             return None
 
         # Try to extract metadata
@@ -150,7 +150,7 @@ class PDFRenamer(BaseRenamer):
             title_extracted = title
         else:
             # Fall back to sanitized original name
-            sanitized_name = sanitize_filename(file.path.stem)
+            sanitized_name = sanitize_filename(file.stem)
             if len(sanitized_name) < 3:
                 new_stem = f"{date_str}_document"
             else:
@@ -85,6 +85,22 @@ class TestArchiveBookDetector:
         assert result.category == "Books"
         assert "3" in result.reason
 
+    def test_matches_member_suffix_case_insensitively(self, tmp_path: Path) -> None:
+        """Uppercase and nested book members count; look-alike suffixes do not."""
+        detector = ArchiveBookDetector()
+        zip_path = tmp_path / "bundle.zip"
+
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            zf.writestr("Library/BOOK.EPUB", b"epub")
+            zf.writestr("notes.epub.txt", b"text")
+            zf.writestr("v1.0/README", b"readme")
+
+        file = FileInfo.from_path(zip_path)
+        result = detector.detect(file)
+
+        assert result is not None
+        assert "1 book file(s) (epub)" in result.reason
+
     def test_ignores_zip_without_books(self, tmp_path: Path) -> None:
         """Ignores ZIP without book files."""
         detector = ArchiveBookDetector()
@@ -230,3 +246,29 @@ class TestArchiveBookDetector:
         assert result is not None
         assert result.category == "Books"
         assert result.confidence == CONFIDENCE_HIGH  # "Edition" is strong
+
+    def test_pro_prefix_does_not_hide_next_keyword(self, tmp_path: Path) -> None:
+        """'Pro' and the keyword right after it count as two indicators."""
+        detector = ArchiveBookDetector()
+
+        file_path = tmp_path / "Pro Guide.rar"
+        file_path.write_bytes(b"rar content")
+        file = FileInfo.from_path(file_path)
+
+        result = detector.detect(file)
+
+        assert result is not None
+        assert result.confidence == CONFIDENCE_MEDIUM
+        assert "2 keywords" in result.reason
+
+    def test_repeated_keyword_counts_once(self, tmp_path: Path) -> None:
+        """The same moderate keyword twice is still a single indicator."""
+        detector = ArchiveBookDetector()
+
+        file_path = tmp_path / "Guide guide GUIDE.rar"
+        file_path.write_bytes(b"rar content")
+        file = FileInfo.from_path(file_path)
+
+        result = detector.detect(file)
+
+        assert result is None
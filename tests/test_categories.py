@@ -1,7 +1,9 @@
 """Tests for category management."""
 
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from tidyup.categories import (
     Category,
@@ -9,6 +11,8 @@ from tidyup.categories import (
     DEFAULT_CATEGORIES,
     UNSORTED_CATEGORY,
     UNSORTED_NUMBER,
+    _parse_config,
+    _plan_renames,
     get_category_manager,
     reset_category_manager,
 )
@@ -32,17 +36,43 @@ class TestCategory:
         cat = Category(number=99, name="Unsorted")
         assert cat.folder_name == "99_Unsorted"
 
-    def test_equality_by_name(self) -> None:
-        """Categories are equal if names match."""
-        cat1 = Category(number=1, name="Documents")
-        cat2 = Category(number=5, name="Documents")
-        assert cat1 == cat2
+    def test_name_lower_precomputed(self) -> None:
+        """Lowercased name is computed at construction."""
+        cat = Category(number=1, name="Documents")
+        assert cat.name_lower == "documents"
+
+    def test_name_is_interned(self) -> None:
+        """Names are interned so equal names share one string object."""
+        built = "".join(["Docu", "ments"])
+        cat = Category(number=1, name=built)
+        assert cat.name is DEFAULT_CATEGORIES[0]
+
+    def test_default_config_path(self, tmp_path: Path, monkeypatch) -> None:
+        """Managers without a config path use ~/.tidy under the current HOME."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        manager = CategoryManager()
+        assert manager.config_path == tmp_path / ".tidy" / "config.yaml"
+
+    def test_uses_slots(self) -> None:
+        """Category and CategoryManager instances have no per-instance __dict__."""
+        cat = Category(number=1, name="Documents")
+        manager = CategoryManager(config_path=Path("/nonexistent/config.yaml"))
 
-    def test_inequality_different_names(self) -> None:
-        """Categories with different names are not equal."""
+        assert not hasattr(cat, "__dict__")
+        assert not hasattr(manager, "__dict__")
+
+    def test_equality_is_identity(self) -> None:
+        """Categories compare by identity; compare names explicitly."""
         cat1 = Category(number=1, name="Documents")
-        cat2 = Category(number=1, name="Images")
+        cat2 = Category(number=1, name="Documents")
+        assert cat1 == cat1
         assert cat1 != cat2
+        assert cat1.name == cat2.name
+
+    def test_hashable(self) -> None:
+        """Categories remain usable in sets and as dict keys."""
+        cat = Category(number=1, name="Documents")
+        assert cat in {cat}
 
 
 class TestCategoryManagerLoad:
@@ -54,7 +84,7 @@ class TestCategoryManagerLoad:
         manager.load()
 
         names = [c.name for c in manager.categories]
-        assert names[:-1] == DEFAULT_CATEGORIES
+        assert names[:-1] == list(DEFAULT_CATEGORIES)
         assert names[-1] == UNSORTED_CATEGORY
 
     def test_load_defaults_correct_numbers(self, tmp_path: Path) -> None:
@@ -91,6 +121,17 @@ class TestCategoryManagerLoad:
         names = [c.name for c in manager.categories]
         assert names == ["Foo", "Bar", "Unsorted"]
 
+    def test_load_numeric_dict_name(self, tmp_path: Path) -> None:
+        """A dict-form name that YAML parses as a number becomes a string."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - name: 2024\n")
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+
+        assert manager.categories[0].name == "2024"
+        assert manager.get_folder_name("2024") == "01_2024"
+
     def test_load_preserves_unsorted(self, tmp_path: Path) -> None:
         """Always includes Unsorted at 99 even if in config."""
         config_path = tmp_path / "config.yaml"
@@ -104,6 +145,116 @@ class TestCategoryManagerLoad:
         assert manager.categories[-1].number == 99
 
 
+class TestCategoryManagerLoadCache:
+    """Tests for the parsed-config cache."""
+
+    def test_second_load_skips_yaml(self, tmp_path: Path) -> None:
+        """Unchanged config is served from the cache without parsing YAML."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - Foo\n  - Bar\n")
+
+        CategoryManager(config_path=config_path).load()
+        _parse_config.cache_clear()
+
+        manager = CategoryManager(config_path=config_path)
+        with patch("tidyup.categories.yaml.load") as mock_load:
+            manager.load()
+
+        mock_load.assert_not_called()
+        assert [c.name for c in manager.categories] == ["Foo", "Bar", "Unsorted"]
+
+    def test_no_custom_categories_cached_as_marker(self, tmp_path: Path) -> None:
+        """A config without categories caches a defaults marker, not a list."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("other_setting: value\n")
+        CategoryManager(config_path=config_path).load()
+        _parse_config.cache_clear()
+
+        assert (tmp_path / "config.cache").read_bytes().endswith(b"DEFAULTS")
+
+        manager = CategoryManager(config_path=config_path)
+        with patch("tidyup.categories.yaml.load") as mock_load:
+            manager.load()
+
+        mock_load.assert_not_called()
+        assert [c.name for c in manager.categories][:-1] == list(DEFAULT_CATEGORIES)
+
+    def test_save_seeds_cache(self, tmp_path: Path) -> None:
+        """A load right after save() is served from the cache."""
+        config_path = tmp_path / "config.yaml"
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        manager.add("Receipts")
+        manager.save()
+
+        reloaded = CategoryManager(config_path=config_path)
+        with patch("tidyup.categories.yaml.load") as mock_load:
+            reloaded.load()
+
+        mock_load.assert_not_called()
+        assert reloaded.get_by_name("Receipts") is not None
+
+    def test_save_all_removed_matches_uncached_load(self, tmp_path: Path) -> None:
+        """Saving an empty category list reloads as defaults, cached or not."""
+        config_path = tmp_path / "config.yaml"
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        for name in DEFAULT_CATEGORIES:
+            manager.remove(name)
+        manager.save()
+
+        reset_category_manager()
+        cached = CategoryManager(config_path=config_path)
+        cached.load()
+
+        reset_category_manager()
+        (tmp_path / "config.cache").unlink()
+        uncached = CategoryManager(config_path=config_path)
+        uncached.load()
+
+        cached_names = [c.name for c in cached.categories]
+        assert cached_names == [c.name for c in uncached.categories]
+        assert cached_names[:-1] == list(DEFAULT_CATEGORIES)
+
+    def test_in_process_memo_skips_disk(self, tmp_path: Path) -> None:
+        """Repeated loads in one process reuse the memoized parse."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - Foo\n")
+        CategoryManager(config_path=config_path).load()
+
+        manager = CategoryManager(config_path=config_path)
+        with patch("tidyup.categories._load_cached") as mock_cached:
+            manager.load()
+
+        mock_cached.assert_not_called()
+        assert [c.name for c in manager.categories] == ["Foo", "Unsorted"]
+
+    def test_reset_clears_memo(self, tmp_path: Path) -> None:
+        """reset_category_manager drops memoized parses."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - Foo\n")
+        CategoryManager(config_path=config_path).load()
+
+        reset_category_manager()
+
+        assert _parse_config.cache_info().currsize == 0
+
+    def test_edited_config_invalidates_cache(self, tmp_path: Path) -> None:
+        """Changing config.yaml is picked up on the next load."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - Foo\n")
+        CategoryManager(config_path=config_path).load()
+
+        config_path.write_text("categories:\n  - Foo\n  - Qux\n")
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+
+        assert [c.name for c in manager.categories] == ["Foo", "Qux", "Unsorted"]
+
+
 class TestCategoryManagerSave:
     """Tests for CategoryManager saving."""
 
@@ -149,6 +300,127 @@ class TestCategoryManagerSave:
         content = config_path.read_text()
         assert "other_setting: value" in content
 
+    def test_save_is_atomic_and_keeps_mode(self, tmp_path: Path) -> None:
+        """save() swaps in a complete file, keeps permissions, leaves no temp files."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - Foo\n")
+        config_path.chmod(0o640)
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        manager.add("Bar")
+        manager.save()
+
+        assert (config_path.stat().st_mode & 0o777) == 0o640
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["config.cache", "config.yaml"]
+        assert "Bar" in config_path.read_text()
+
+    def test_save_writes_through_symlink(self, tmp_path: Path) -> None:
+        """A symlinked config.yaml keeps its link; the target gets the change."""
+        real = tmp_path / "dotfiles" / "config.yaml"
+        real.parent.mkdir()
+        real.write_text("categories:\n  - Foo\n  - Bar\n")
+        link_dir = tmp_path / ".tidy"
+        link_dir.mkdir()
+        link = link_dir / "config.yaml"
+        link.symlink_to(real)
+
+        manager = CategoryManager(config_path=link)
+        manager.load()
+        manager.add("Baz")
+        manager.save()
+
+        assert link.is_symlink()
+        assert "Baz" in real.read_text()
+        assert [p.name for p in real.parent.iterdir()] == ["config.yaml"]
+
+    def test_save_new_config_uses_umask_mode(self, tmp_path: Path) -> None:
+        """A freshly created config.yaml gets 0666 minus the umask, not 0600."""
+        config_path = tmp_path / "config.yaml"
+        old_umask = os.umask(0o022)
+        try:
+            manager = CategoryManager(config_path=config_path)
+            manager.load()
+            manager.save()
+        finally:
+            os.umask(old_umask)
+
+        assert (config_path.stat().st_mode & 0o777) == 0o644
+
+    def test_save_after_other_managers_save_skips_parse(self, tmp_path: Path) -> None:
+        """A config written by save() is remembered for later saves in the process."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("other_setting: value\ncategories:\n  - Foo\n")
+        first = CategoryManager(config_path=config_path)
+        first.load()
+        first.add("Bar")
+        first.save()
+
+        second = CategoryManager(config_path=config_path)
+        with patch("tidyup.categories.yaml.load") as mock_load:
+            second.load()
+            second.add("Baz")
+            second.save()
+
+        mock_load.assert_not_called()
+        content = config_path.read_text()
+        assert "other_setting: value" in content
+        assert "Baz" in content
+
+    def test_save_roundtrips_non_ascii(self, tmp_path: Path) -> None:
+        """Names outside ASCII survive a save and reload."""
+        config_path = tmp_path / "config.yaml"
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        manager.add("Música")
+        manager.save()
+        reset_category_manager()
+
+        reloaded = CategoryManager(config_path=config_path)
+        reloaded.load()
+
+        assert reloaded.get_by_name("música") is not None
+
+    def test_save_unchanged_is_noop(self, tmp_path: Path) -> None:
+        """save() does not rewrite a config whose categories did not change."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("# my notes\ncategories:\n  - Foo\n")
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        manager.save()
+
+        assert config_path.read_text() == "# my notes\ncategories:\n  - Foo\n"
+
+    def test_save_after_mark_dirty_writes(self, tmp_path: Path) -> None:
+        """mark_dirty() forces the next save() to write."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("# my notes\ncategories:\n  - Foo\n")
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        manager.mark_dirty()
+        manager.save()
+
+        assert "# my notes" not in config_path.read_text()
+
+    def test_save_after_load_skips_reparse(self, tmp_path: Path) -> None:
+        """save() reuses the config parsed by load() and by the previous save."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("other_setting: value\ncategories:\n  - Old\n")
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        with patch("tidyup.categories.yaml.load") as mock_load:
+            manager.save()
+            manager.add("New")
+            manager.save()
+
+        mock_load.assert_not_called()
+        content = config_path.read_text()
+        assert "other_setting: value" in content
+        assert "New" in content
+
 
 class TestCategoryManagerLookup:
     """Tests for CategoryManager lookups."""
@@ -179,6 +451,32 @@ class TestCategoryManagerLookup:
         cat = manager.get_by_name("NonExistent")
         assert cat is None
 
+    def test_get_by_name_tracks_mutations(self, tmp_path: Path) -> None:
+        """Lookup index follows add, remove and reorder."""
+        manager = CategoryManager(config_path=tmp_path / "config.yaml")
+        manager.load()
+
+        manager.add("Receipts")
+        assert manager.get_by_name("receipts") is not None
+
+        manager.remove("Receipts")
+        assert manager.get_by_name("receipts") is None
+
+        names = [c.name for c in manager.categories if c.number != 99]
+        manager.reorder(list(reversed(names)))
+        cat = manager.get_by_name(names[-1])
+        assert cat is not None
+        assert cat.number == 1
+
+    def test_get_by_name_direct_construction(self) -> None:
+        """Index is built for categories passed to the constructor."""
+        docs = Category(number=1, name="Documents")
+        manager = CategoryManager(
+            categories=[docs],
+            config_path=Path("/nonexistent/config.yaml"),
+        )
+        assert manager.get_by_name("documents") is docs
+
     def test_get_folder_name(self, tmp_path: Path) -> None:
         """Returns folder name for category."""
         manager = CategoryManager(config_path=tmp_path / "config.yaml")
@@ -238,6 +536,34 @@ class TestCategoryManagerAdd:
         names = [c.name for c in manager.categories if c.name != "Unsorted"]
         assert names == ["Baz", "Foo", "Bar"]
 
+    def test_add_renumbers_in_place(self, tmp_path: Path) -> None:
+        """Existing Category objects are kept and renumbered, Unsorted stays last."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - Foo\n  - Bar\n")
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        foo = manager.categories[0]
+        unsorted = manager.categories[-1]
+        manager.add("Baz", position=1)
+
+        assert manager.categories[1] is foo
+        assert foo.number == 2
+        assert manager.categories[-1] is unsorted
+        assert unsorted.number == 99
+
+    def test_add_refreshes_folder_names(self, tmp_path: Path) -> None:
+        """Cached folder names follow renumbering."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("categories:\n  - Foo\n  - Bar\n")
+
+        manager = CategoryManager(config_path=config_path)
+        manager.load()
+        manager.add("Baz", position=1)
+
+        folders = [c.folder_name for c in manager.categories]
+        assert folders == ["01_Baz", "02_Foo", "03_Bar", "99_Unsorted"]
+
     def test_add_duplicate_raises(self, tmp_path: Path) -> None:
         """Raises ValueError when adding duplicate."""
         manager = CategoryManager(config_path=tmp_path / "config.yaml")
@@ -385,9 +711,10 @@ class TestCategoryManagerFilesystem:
         manager = CategoryManager(config_path=config_path)
         manager.load()
 
-        renames = manager.apply_to_filesystem(tmp_path)
+        renames, skipped = manager.apply_to_filesystem(tmp_path)
 
         assert len(renames) == 2
+        assert skipped == []
         assert (tmp_path / "01_Bar").exists()
         assert (tmp_path / "02_Foo").exists()
 
@@ -402,9 +729,10 @@ class TestCategoryManagerFilesystem:
         manager = CategoryManager(config_path=config_path)
         manager.load()
 
-        renames = manager.apply_to_filesystem(tmp_path, dry_run=True)
+        renames, skipped = manager.apply_to_filesystem(tmp_path, dry_run=True)
 
         assert len(renames) == 2
+        assert skipped == []
         # Original folders should still exist
         assert (tmp_path / "01_Foo").exists()
         assert (tmp_path / "02_Bar").exists()
@@ -417,11 +745,92 @@ class TestCategoryManagerFilesystem:
         manager = CategoryManager(config_path=tmp_path / "config.yaml")
         manager.load()
 
-        renames = manager.apply_to_filesystem(tmp_path)
+        manager.apply_to_filesystem(tmp_path)
 
         # Should not rename random_folder
         assert (tmp_path / "random_folder").exists()
 
+    def test_apply_ignores_files_and_bad_prefixes(self, tmp_path: Path) -> None:
+        """Skips plain files and folders without a numeric prefix."""
+        (tmp_path / "05_Documents").write_text("not a folder")
+        (tmp_path / "xx_Documents").mkdir()
+        (tmp_path / "_Documents").mkdir()
+
+        manager = CategoryManager(config_path=tmp_path / "config.yaml")
+        manager.load()
+
+        assert manager.apply_to_filesystem(tmp_path) == ([], [])
+
+    def test_apply_skips_occupied_target(self, tmp_path: Path) -> None:
+        """A duplicate folder is left alone and reported as skipped."""
+        (tmp_path / "01_Documents").mkdir()
+        (tmp_path / "05_Documents").mkdir()
+
+        manager = CategoryManager(config_path=tmp_path / "config.yaml")
+        manager.load()
+
+        assert manager.apply_to_filesystem(tmp_path) == (
+            [],
+            [(tmp_path / "05_Documents", tmp_path / "01_Documents")],
+        )
+        assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == [
+            "01_Documents",
+            "05_Documents",
+        ]
+
+
+class TestRenamePlanner:
+    """Tests for the folder rename planner."""
+
+    def test_shared_target_skipped(self, tmp_path: Path) -> None:
+        """Duplicate folders competing for one target are both skipped."""
+        renames = [
+            (tmp_path / "03_Foo", tmp_path / "01_Foo"),
+            (tmp_path / "05_foo", tmp_path / "01_Foo"),
+        ]
+
+        planned, skipped = _plan_renames(renames, ["03_Foo", "05_foo"])
+
+        assert planned == []
+        assert skipped == renames
+
+    def test_case_variant_occupant_blocks(self, tmp_path: Path) -> None:
+        """A target differing only in case counts as taken."""
+        rename = (tmp_path / "05_Documents", tmp_path / "01_Documents")
+
+        assert _plan_renames([rename], ["05_Documents", "01_documents"]) == ([], [rename])
+
+    def test_case_only_rename_allowed(self, tmp_path: Path) -> None:
+        """A folder may be renamed to a case variant of its own name."""
+        rename = (tmp_path / "01_documents", tmp_path / "01_Documents")
+
+        assert _plan_renames([rename], ["01_documents"]) == ([rename], [])
+
+    def test_planning_does_not_stat_targets(self, tmp_path: Path) -> None:
+        """Conflicts are resolved from the scanned names alone."""
+        rename = (tmp_path / "03_Foo", tmp_path / "01_Foo")
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+            result = _plan_renames([rename], ["03_Foo"])
+
+        assert result == ([rename], [])
+
+class TestCategoryManagerListCategories:
+    """Tests for list_categories snapshots."""
+
+    def test_snapshot_reused_until_mutation(self, tmp_path: Path) -> None:
+        """Returns the same tuple until categories change."""
+        manager = CategoryManager(config_path=tmp_path / "config.yaml")
+        manager.load()
+
+        first = manager.list_categories()
+        assert isinstance(first, tuple)
+        assert manager.list_categories() is first
+
+        manager.add("Receipts")
+        second = manager.list_categories()
+        assert second is not first
+        assert "Receipts" in [c.name for c in second]
+
 
 class TestCategoryManagerLegacy:
     """Tests for legacy compatibility."""
@@ -1,10 +1,15 @@
 """Tests for the CLI interface."""
 
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 from pathlib import Path
 
-from tidyup.cli import main
+from unittest.mock import patch
+
+from tidyup.cli import _folder_stats, _looks_like_path, _walk_files, main
 from tidyup import __version__
 
 
@@ -41,6 +46,23 @@ class TestCLIHelp:
         assert result.exit_code == 0
         assert __version__ in result.output
 
+    @pytest.mark.parametrize("flag", ["--help", "--version"])
+    def test_help_and_version_stay_lazy(self, flag: str) -> None:
+        """--help and --version never import Rich or the engine stack."""
+        code = (
+            "import sys\n"
+            "from tidyup.cli import main\n"
+            f"try:\n    main([{flag!r}])\n"
+            "except SystemExit:\n    pass\n"
+            "heavy = ('rich', 'tidyup.engine', 'tidyup.logger', 'tidyup.categories')\n"
+            "print(sorted(m for m in heavy if m in sys.modules))\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert proc.stdout.strip().splitlines()[-1] == "[]"
+
     def test_no_args_shows_help(self, cli_runner: CliRunner) -> None:
         """tidy with no args shows help."""
         result = cli_runner.invoke(main, [])
@@ -76,6 +98,28 @@ class TestSubcommands:
         assert result.exit_code == 0
         assert "Status" in result.output
 
+    def test_status_counts_files_per_folder(
+        self, cli_runner: CliRunner, tmp_path: Path, monkeypatch
+    ) -> None:
+        """status totals nested files per top-level folder and skips hidden ones."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        dest = tmp_path / "Documents" / "Organized"
+        (dest / "01_Documents" / "2024").mkdir(parents=True)
+        (dest / "01_Documents" / "a.pdf").write_bytes(b"aaa")
+        (dest / "01_Documents" / "2024" / "b.pdf").write_bytes(b"bb")
+        (dest / "02_Images").mkdir()
+        (dest / ".cache").mkdir()
+        (dest / ".cache" / "junk").write_bytes(b"x" * 100)
+        (dest / "loose.txt").write_bytes(b"loose")
+
+        result = cli_runner.invoke(main, ["status"])
+
+        assert result.exit_code == 0
+        row = next(line for line in result.output.splitlines() if "01_Documents/" in line)
+        assert "2" in row and "5 B" in row
+        assert "02_Images/" not in result.output
+        assert ".cache" not in result.output
+
     def test_reindex_runs_without_error(self, cli_runner: CliRunner) -> None:
         """tidy reindex runs without error."""
         result = cli_runner.invoke(main, ["reindex"])
@@ -122,6 +166,18 @@ class TestCLIFlags:
         assert result.exit_code == 0
         assert "skip" in result.output.lower() or "Skip" in result.output
 
+    def test_limit_zero_skips_engine(
+        self, cli_runner: CliRunner, temp_source: Path, tmp_path: Path
+    ) -> None:
+        """--limit 0 returns before the engine touches anything."""
+        dest = tmp_path / "dest"
+        result = cli_runner.invoke(main, [str(temp_source), str(dest), "--limit", "0"])
+
+        assert result.exit_code == 0
+        assert "Nothing to do" in result.output
+        assert "Summary" not in result.output
+        assert not dest.exists()
+
     def test_path_without_run_command_works(self, cli_runner: CliRunner, temp_source: Path) -> None:
         """Passing a path directly (without 'run') should work."""
         result = cli_runner.invoke(main, [str(temp_source), "--dry-run"])
@@ -137,6 +193,78 @@ class TestCLIFlags:
         assert "TidyUp" in result.output
 
 
+class TestPathSniffing:
+    """Tests for detecting a bare path as the organize command."""
+
+    @pytest.mark.parametrize("arg", [".", "..", "~/Downloads", "./inbox", "/tmp/x"])
+    def test_path_like_args_skip_stat(self, arg: str) -> None:
+        """Path-like strings are recognised without touching the filesystem."""
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+            assert _looks_like_path(arg)
+
+    def test_bare_name_checks_filesystem(self, tmp_path: Path, monkeypatch) -> None:
+        """A bare name is a path only if it exists."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "Downloads").mkdir()
+
+        assert _looks_like_path("Downloads")
+        assert not _looks_like_path("Nowhere")
+
+    def test_subcommand_does_not_stat(self, cli_runner: CliRunner) -> None:
+        """Known subcommands never reach the filesystem check."""
+        with patch("tidyup.cli._looks_like_path") as mock_sniff:
+            cli_runner.invoke(main, ["reindex"])
+
+        mock_sniff.assert_not_called()
+
+
+class TestWalkFiles:
+    """Tests for the recursive file walk used by status."""
+
+    def test_yields_nested_files(self, tmp_path: Path) -> None:
+        """Files at every depth are yielded; directories are not."""
+        (tmp_path / "a.txt").write_text("a")
+        (tmp_path / "sub" / "deep").mkdir(parents=True)
+        (tmp_path / "sub" / "b.txt").write_text("bb")
+        (tmp_path / "sub" / "deep" / "c.txt").write_text("ccc")
+
+        entries = list(_walk_files(tmp_path))
+
+        assert sorted(e.name for e in entries) == ["a.txt", "b.txt", "c.txt"]
+        assert sum(e.stat().st_size for e in entries) == 6
+
+    def test_does_not_follow_directory_symlinks(self, tmp_path: Path) -> None:
+        """Symlinked directories are not descended into."""
+        target = tmp_path / "target"
+        target.mkdir()
+        (target / "x.txt").write_text("x")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "link").symlink_to(target)
+
+        assert list(_walk_files(root)) == []
+
+    def test_skips_file_symlinks(self, tmp_path: Path) -> None:
+        """Symlinked files are not counted, so sizes come from real files only."""
+        (tmp_path / "real.txt").write_text("real")
+        (tmp_path / "alias.txt").symlink_to(tmp_path / "real.txt")
+
+        assert [e.name for e in _walk_files(tmp_path)] == ["real.txt"]
+
+    def test_missing_root_yields_nothing(self, tmp_path: Path) -> None:
+        """A vanished directory is skipped rather than raising."""
+        assert list(_walk_files(tmp_path / "gone")) == []
+
+    def test_folder_stats_totals(self, tmp_path: Path) -> None:
+        """_folder_stats returns the file count and byte total of a subtree."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.bin").write_bytes(b"1234")
+        (tmp_path / "sub" / "b.bin").write_bytes(b"56")
+
+        assert _folder_stats(tmp_path) == (2, 6)
+        assert _folder_stats(tmp_path / "gone") == (0, 0)
+
+
 class TestCategoriesCommands:
     """Tests for categories subcommands."""
 
@@ -192,3 +320,20 @@ class TestCategoriesCommands:
         assert result.exit_code == 0
         # Either shows "No folders need renaming" or "DRY RUN"
         assert "No folders" in result.output or "DRY RUN" in result.output
+
+    def test_categories_apply_reports_skipped(
+        self, cli_runner: CliRunner, tmp_path: Path, monkeypatch
+    ) -> None:
+        """categories apply lists folders it could not rename."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setattr("tidyup.categories._manager", None)
+        dest = tmp_path / "Organized"
+        (dest / "01_Documents").mkdir(parents=True)
+        (dest / "05_Documents").mkdir()
+
+        result = cli_runner.invoke(main, ["categories", "apply", str(dest)])
+
+        assert result.exit_code == 0
+        assert "No folders need renaming" not in result.output
+        assert "Skipped 1 folder(s)" in result.output
+        assert (dest / "05_Documents").is_dir()
@@ -1,9 +1,19 @@
 """Tests for content extraction utilities."""
 
+import re
+
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
-from tidyup.detectors.content import extract_pdf_text, extract_pdf_text_cached
+from tidyup.detectors import content
+from tidyup.detectors.content import (
+    compile_keywords,
+    count_keywords,
+    extract_pdf_text,
+    extract_pdf_text_cached,
+    matched_keywords,
+)
 
 
 class TestExtractPdfText:
@@ -63,6 +73,42 @@ class TestExtractPdfText:
         assert result is None
 
 
+class TestPdfBackends:
+    """Tests for choosing between PyMuPDF and pypdf."""
+
+    def test_uses_pymupdf_when_available(self, tmp_path: Path, monkeypatch) -> None:
+        """With PyMuPDF importable, pages come from it and limits still apply."""
+        opened = []
+
+        class _Doc:
+            def __init__(self, path: Path) -> None:
+                opened.append(path)
+                self.pages = [
+                    SimpleNamespace(get_text=lambda mode: "first page "),
+                    SimpleNamespace(get_text=lambda mode: ""),
+                    SimpleNamespace(get_text=lambda mode: "never read"),
+                ]
+
+            def __enter__(self) -> list:
+                return self.pages
+
+            def __exit__(self, *exc: object) -> None:
+                return None
+
+        monkeypatch.setattr(content, "pymupdf", SimpleNamespace(open=_Doc))
+        pdf = tmp_path / "doc.pdf"
+
+        assert extract_pdf_text(pdf, max_pages=2) == "first page "
+        assert opened == [pdf]
+
+    def test_falls_back_to_pypdf(self, tmp_path: Path, monkeypatch) -> None:
+        """Without PyMuPDF, pypdf does the extraction."""
+        monkeypatch.setattr(content, "pymupdf", None)
+        monkeypatch.setattr(content, "_extract_pages_pypdf", lambda p, mp, mc: ["a", "b"])
+
+        assert extract_pdf_text(tmp_path / "doc.pdf") == "a\nb"
+
+
 class TestExtractPdfTextCached:
     """Tests for cached PDF text extraction."""
 
@@ -82,3 +128,32 @@ class TestExtractPdfTextCached:
         # Check cache was hit
         info = extract_pdf_text_cached.cache_info()
         assert info.hits >= 1
+
+
+class TestKeywordScan:
+    """Tests for the single-pass keyword alternation helpers."""
+
+    KEYWORDS = [r"\babstract\b", r"\bet\s+al\.?\b", r"\bresults?\b", r"\brecibo\b", r"\brecibo\b"]
+
+    def test_matched_keywords_reports_sources(self) -> None:
+        """Each keyword found anywhere in the text is reported once."""
+        pattern = compile_keywords(self.KEYWORDS)
+        text = "ABSTRACT ... Smith et al. report results; more results"
+
+        found = matched_keywords(pattern, self.KEYWORDS, text)
+
+        assert found == {r"\babstract\b", r"\bet\s+al\.?\b", r"\bresults?\b"}
+
+    def test_count_matches_separate_searches(self) -> None:
+        """Counts agree with one search per keyword, duplicates included."""
+        pattern = compile_keywords(self.KEYWORDS)
+        text = "Recibo de pago, abstracts are not an abstract"
+
+        expected = sum(1 for k in self.KEYWORDS if re.search(k, text, re.IGNORECASE))
+
+        assert count_keywords(pattern, self.KEYWORDS, text) == expected == 3
+
+    def test_word_boundary_is_required(self) -> None:
+        """Keywords without a leading word boundary are rejected."""
+        with pytest.raises(ValueError):
+            compile_keywords([r"abstract\b"])
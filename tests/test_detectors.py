@@ -2,8 +2,9 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
-from tidyup.models import FileInfo
+from tidyup.models import DetectionResult, FileInfo
 from tidyup.detectors import (
     BaseDetector,
     DetectorRegistry,
@@ -100,6 +101,48 @@ class TestDetectorRegistry:
         # Screenshot detector should win (same confidence, lower priority)
         assert result.detector_name == "ScreenshotDetector"
 
+    def test_high_confidence_skips_remaining_detectors(self, tmp_path: Path) -> None:
+        """A high confidence hit returns before lower-priority detectors run."""
+        registry = DetectorRegistry()
+        registry.register(ScreenshotDetector())
+        generic = GenericDetector()
+        registry.register(generic)
+
+        file_path = tmp_path / "Screenshot 2024-01-15 at 10.30.45.png"
+        file_path.write_text("content")
+        file = FileInfo.from_path(file_path)
+
+        with patch.object(generic, "detect", side_effect=AssertionError("ran")):
+            result = registry.detect(file)
+
+        assert result.detector_name == "ScreenshotDetector"
+
+    def test_earlier_detector_wins_ties_below_high(self, tmp_path: Path) -> None:
+        """Equal medium confidence keeps the more specific detector's result."""
+
+        class _Medium(BaseDetector):
+            def __init__(self, label: str, priority: int) -> None:
+                self.label = label
+                self.priority = priority
+
+            @property
+            def name(self) -> str:
+                return self.label
+
+            def detect(self, file: FileInfo) -> DetectionResult | None:
+                return DetectionResult(
+                    category="Documents", confidence=CONFIDENCE_MEDIUM, detector_name=self.label
+                )
+
+        registry = DetectorRegistry()
+        registry.register(_Medium("late", 40))
+        registry.register(_Medium("early", 5))
+
+        file_path = tmp_path / "a.txt"
+        file_path.write_text("content")
+
+        assert registry.detect(FileInfo.from_path(file_path)).detector_name == "early"
+
 
 class TestGenericDetector:
     """Tests for GenericDetector."""
@@ -383,6 +426,27 @@ class TestArxivDetector:
 
         assert detector.detect(file) is None
 
+    @pytest.mark.parametrize(
+        "name",
+        ["2501.12948v10.pdf", "2501.12948.PDF", "2501.1294.pdf"],
+    )
+    def test_detects_edge_shapes(self, tmp_path: Path, name: str) -> None:
+        """Long version suffixes, uppercase extensions and 4-digit ids match."""
+        detector = ArxivDetector()
+        file_path = tmp_path / name
+        file_path.write_text("content")
+
+        assert detector.detect(FileInfo.from_path(file_path)) is not None
+
+    @pytest.mark.parametrize("name", ["2501.12948.v2.pdf", "2501.12948x.pdf", "a.pdf"])
+    def test_rejects_near_misses(self, tmp_path: Path, name: str) -> None:
+        """Trailing junk and short stems are rejected."""
+        detector = ArxivDetector()
+        file_path = tmp_path / name
+        file_path.write_text("content")
+
+        assert detector.detect(FileInfo.from_path(file_path)) is None
+
 
 class TestGlobalRegistry:
     """Tests for global registry."""
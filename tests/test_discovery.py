@@ -1,5 +1,6 @@
 """Tests for file discovery module."""
 
+import os
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -37,6 +38,20 @@ class TestShouldSkipPattern:
         """Empty pattern list returns False."""
         assert should_skip_pattern("anything.txt", []) is False
 
+    def test_mixed_glob_patterns(self) -> None:
+        """Patterns that are neither literals nor suffixes still match."""
+        assert should_skip_pattern("draft-1.txt", ["draft-?.txt"]) is True
+        assert should_skip_pattern("draft-12.txt", ["draft-?.txt"]) is False
+        assert should_skip_pattern("notes.bak", ["*.tmp", "*.[bB]ak"]) is True
+
+    def test_combined_patterns_match_whole_name(self) -> None:
+        """Combined patterns only match full filenames, not substrings."""
+        patterns = DEFAULT_SKIP_PATTERNS
+        assert should_skip_pattern("backup.txt~", patterns) is True
+        assert should_skip_pattern("Thumbs.db", patterns) is True
+        assert should_skip_pattern("file.tmp.pdf", patterns) is False
+        assert should_skip_pattern("Thumbs.db.pdf", patterns) is False
+
 
 class TestShouldSkipRecent:
     """Tests for should_skip_recent function."""
@@ -136,6 +151,15 @@ class TestDiscoverFiles:
 
         assert len(files) == 3
 
+    def test_limit_yields_first_files_in_order(self, tmp_path: Path) -> None:
+        """With a limit, the alphabetically first files are yielded in order."""
+        for name in ["delta", "alpha", "echo", "charlie", "bravo"]:
+            (tmp_path / f"{name}.txt").write_text("content")
+
+        files = list(discover_files(tmp_path, limit=3))
+
+        assert [f.name for f in files] == ["alpha.txt", "bravo.txt", "charlie.txt"]
+
     def test_limit_none_returns_all(self, tmp_path: Path) -> None:
         """Limit=None returns all files."""
         for i in range(5):
@@ -155,6 +179,18 @@ class TestDiscoverFiles:
         # File was just created, so should be skipped
         assert len(files) == 0
 
+    def test_skip_recent_hours_includes_old_files(self, tmp_path: Path) -> None:
+        """Files older than skip_recent_hours are still discovered."""
+        old_file = tmp_path / "old.txt"
+        old_file.write_text("content")
+        old_time = (datetime.now() - timedelta(hours=3)).timestamp()
+        os.utime(old_file, (old_time, old_time))
+        (tmp_path / "recent.txt").write_text("content")
+
+        files = list(discover_files(tmp_path, skip_recent_hours=1))
+
+        assert [f.name for f in files] == ["old.txt"]
+
     def test_skip_recent_hours_zero_includes_all(self, tmp_path: Path) -> None:
         """skip_recent_hours=0 includes all files."""
         (tmp_path / "recent.txt").write_text("content")
@@ -91,6 +91,32 @@ class TestDetectCategory:
         assert result.reason is not None
 
 
+class TestGetFolderName:
+    """Tests for category folder name resolution."""
+
+    def test_resolves_known_category(self, tmp_path: Path) -> None:
+        """Known categories map to their numbered folder."""
+        engine = Engine(tmp_path)
+
+        assert engine._get_folder_name("Documents").endswith("_Documents")
+
+    def test_unknown_category_falls_back_to_unsorted(self, tmp_path: Path) -> None:
+        """Unknown categories map to the Unsorted folder."""
+        engine = Engine(tmp_path)
+
+        assert engine._get_folder_name("NoSuchCategory") == "99_Unsorted"
+
+    def test_resolution_is_memoized(self, tmp_path: Path) -> None:
+        """Each category is looked up in the manager once per engine."""
+        engine = Engine(tmp_path)
+        first = engine._get_folder_name("Documents")
+
+        with patch("tidyup.engine.get_category_manager") as mock_manager:
+            assert engine._get_folder_name("Documents") == first
+
+        mock_manager.assert_not_called()
+
+
 class TestGenerateNewName:
     """Tests for filename generation."""
 
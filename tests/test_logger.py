@@ -11,6 +11,7 @@ from tidyup.logger import (
     get_tidy_dir,
     ActionLogger,
     load_log,
+    load_summary,
     list_logs,
     aggregate_logs,
 )
@@ -38,6 +39,23 @@ class TestEnsureLogDir:
 
             assert result == log_dir
 
+    def test_mkdir_runs_once_per_directory(self, tmp_path: Path) -> None:
+        """Repeated calls don't re-create the directory."""
+        with patch("tidyup.logger.get_tidy_dir", return_value=tmp_path):
+            ensure_log_dir()
+            with patch.object(Path, "mkdir") as mock_mkdir:
+                ensure_log_dir()
+
+            mock_mkdir.assert_not_called()
+
+    def test_follows_home_changes(self, tmp_path: Path, monkeypatch) -> None:
+        """The tidy dir tracks HOME at call time, not at import."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        assert get_tidy_dir() == tmp_path / ".tidy"
+        assert ensure_log_dir() == tmp_path / ".tidy" / "logs"
+        assert (tmp_path / ".tidy" / "logs").is_dir()
+
 
 class TestActionLogger:
     """Tests for ActionLogger class."""
@@ -144,7 +162,7 @@ class TestActionLogger:
 
     def test_save_creates_json_file(self, tmp_path: Path) -> None:
         """save creates JSON file with correct format."""
-        with patch("tidyup.logger.ensure_log_dir", return_value=tmp_path):
+        with patch("tidyup.logger.get_tidy_dir", return_value=tmp_path):
             logger = ActionLogger(
                 tmp_path / "source",
                 tmp_path / "dest",
@@ -165,6 +183,48 @@ class TestActionLogger:
             assert data["options"]["move"] is True
             assert "summary" in data
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("n_actions", [0, 2])
+    def test_save_matches_indented_dump(
+        self, tmp_path: Path, sample_pdf: Path, use_orjson: bool, n_actions: int
+    ) -> None:
+        """Streamed log output equals json.dumps of to_dict with indent=2."""
+        import tidyup.logger as logger_module
+
+        orjson_module = logger_module.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson not installed")
+
+        with patch("tidyup.logger.get_tidy_dir", return_value=tmp_path), \
+                patch("tidyup.logger.orjson", orjson_module):
+            logger = ActionLogger(tmp_path / "source", tmp_path / "dest", {"move": True})
+            for i in range(n_actions):
+                logger.log_action(Action(
+                    file=FileInfo.from_path(sample_pdf),
+                    detection=DetectionResult("Documents", 0.9, "TestDetector", "Résumé"),
+                    source_path=sample_pdf,
+                    dest_path=tmp_path / "dest" / f"file{i}.pdf",
+                    status="success",
+                    rename=RenameResult("old.pdf", f"new{i}.pdf", "TestRenamer"),
+                ))
+
+            log_path = logger.save()
+
+        expected = json.dumps(logger.get_run_result().to_dict(), indent=2, ensure_ascii=False)
+        assert log_path.read_text(encoding="utf-8") == expected
+
+    def test_save_round_trips_without_orjson(self, tmp_path: Path) -> None:
+        """save/load_log fall back to stdlib json when orjson is missing."""
+        with patch("tidyup.logger.get_tidy_dir", return_value=tmp_path), \
+                patch("tidyup.logger.orjson", None):
+            logger = ActionLogger(tmp_path / "source", tmp_path / "dest", {})
+            logger.summary.processed = 3
+
+            result = load_log(logger.save())
+
+        assert result.summary.processed == 3
+        assert result.source == tmp_path / "source"
+
 
 class TestLoadLog:
     """Tests for load_log function."""
@@ -212,6 +272,49 @@ class TestLoadLog:
             load_log(log_path)
 
 
+class TestLoadSummary:
+    """Tests for load_summary function."""
+
+    def test_reads_summary_sidecar(self, tmp_path: Path) -> None:
+        """save writes a summary sidecar that load_summary reads."""
+        with patch("tidyup.logger.get_tidy_dir", return_value=tmp_path):
+            logger = ActionLogger(tmp_path / "source", tmp_path / "dest", {})
+            logger.summary.moved = 4
+            log_path = logger.save()
+
+        assert (tmp_path / "logs" / "summaries" / log_path.name).exists()
+        assert load_summary(log_path).moved == 4
+
+    def test_falls_back_to_full_log(self, tmp_path: Path) -> None:
+        """Logs without a sidecar are parsed in full."""
+        log_path = tmp_path / "2024-01-15_120000.json"
+        log_path.write_text(json.dumps({
+            "timestamp": "2024-01-15T12:00:00",
+            "source": "/source",
+            "destination": "/dest",
+            "summary": {"processed": 6},
+        }))
+
+        assert load_summary(log_path).processed == 6
+
+    @pytest.mark.parametrize("sidecar", ['{"processed": ', "[1, 2]", ""])
+    def test_corrupt_sidecar_falls_back_to_full_log(
+        self, tmp_path: Path, sidecar: str
+    ) -> None:
+        """A truncated or malformed sidecar does not hide a valid log."""
+        log_path = tmp_path / "2024-01-15_120000.json"
+        log_path.write_text(json.dumps({
+            "timestamp": "2024-01-15T12:00:00",
+            "source": "/source",
+            "destination": "/dest",
+            "summary": {"processed": 6},
+        }))
+        (tmp_path / "summaries").mkdir()
+        (tmp_path / "summaries" / log_path.name).write_text(sidecar)
+
+        assert load_summary(log_path).processed == 6
+
+
 class TestListLogs:
     """Tests for list_logs function."""
 
@@ -328,6 +431,48 @@ class TestAggregateLogs:
             assert result["total_runs"] == 0
             assert result["total_processed"] == 0
 
+    def test_counts_only_logs_after_cutoff(self, tmp_path: Path) -> None:
+        """Mixed old and recent logs: only recent ones are counted."""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+
+        for days_ago in (0, 1, 10, 30):
+            day = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+            (log_dir / f"{day}_120000.json").write_text(json.dumps({
+                "timestamp": f"{day}T12:00:00",
+                "source": "/source",
+                "destination": "/dest",
+                "summary": {"processed": 1},
+            }))
+
+        with patch("tidyup.logger.get_tidy_dir", return_value=tmp_path):
+            result = aggregate_logs(days=7)
+
+            assert result["total_runs"] == 2
+            assert result["total_processed"] == 2
+
+    def test_aggregates_many_logs(self, tmp_path: Path) -> None:
+        """Large log sets (read in parallel) aggregate the same way."""
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        for i in range(20):
+            (log_dir / f"{today}_1200{i:02d}.json").write_text(json.dumps({
+                "timestamp": f"{today}T12:00:{i:02d}",
+                "source": "/source",
+                "destination": "/dest",
+                "summary": {"processed": 2, "errors": 1},
+            }))
+        (log_dir / f"{today}_130000.json").write_text("invalid json {{{")
+
+        with patch("tidyup.logger.get_tidy_dir", return_value=tmp_path):
+            result = aggregate_logs(days=7)
+
+            assert result["total_runs"] == 20
+            assert result["total_processed"] == 40
+            assert result["total_errors"] == 20
+
     def test_skips_invalid_logs(self, tmp_path: Path) -> None:
         """Skips logs that can't be parsed."""
         log_dir = tmp_path / "logs"
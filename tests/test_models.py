@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+import os
 import pytest
 from datetime import datetime, date
 from pathlib import Path
@@ -37,6 +38,29 @@ class TestFileInfo:
 
         assert info.extension == ""
 
+    @pytest.mark.parametrize(
+        "name,expected",
+        [("Report.PDF", "pdf"), (".bashrc", ""), ("archive.tar.gz", "gz"), ("trailing.", "")],
+    )
+    def test_extension_matches_path_suffix(
+        self, tmp_path: Path, name: str, expected: str
+    ) -> None:
+        """Extension extraction follows Path.suffix rules."""
+        file_path = tmp_path / name
+        file_path.write_text("content")
+
+        assert FileInfo.from_path(file_path).extension == expected
+
+    @pytest.mark.parametrize(
+        "name", ["Report.PDF", ".bashrc", "archive.tar.gz", "trailing.", "noext"]
+    )
+    def test_stem_matches_path_stem(self, tmp_path: Path, name: str) -> None:
+        """FileInfo.stem follows Path.stem rules."""
+        file_path = tmp_path / name
+        file_path.write_text("content")
+
+        assert FileInfo.from_path(file_path).stem == file_path.stem
+
     def test_to_dict_serializes_correctly(self, sample_pdf: Path) -> None:
         """FileInfo.to_dict produces valid JSON-serializable dict."""
         info = FileInfo.from_path(sample_pdf)
@@ -49,6 +73,29 @@ class TestFileInfo:
         assert isinstance(d["modified"], str)  # ISO format string
         assert isinstance(d["created"], str)
 
+    def test_timestamps_stored_as_epoch(self, sample_pdf: Path) -> None:
+        """Timestamps are kept as floats and converted on access."""
+        info = FileInfo.from_path(sample_pdf)
+
+        assert isinstance(info.mtime, float)
+        assert info.modified == datetime.fromtimestamp(info.mtime)
+        assert info.created == datetime.fromtimestamp(info.ctime)
+
+    def test_uses_slots(self, sample_pdf: Path) -> None:
+        """FileInfo instances have no per-instance __dict__."""
+        info = FileInfo.from_path(sample_pdf)
+
+        assert not hasattr(info, "__dict__")
+
+    def test_from_dirent_matches_from_path(self, sample_pdf: Path) -> None:
+        """FileInfo.from_dirent builds the same FileInfo as from_path."""
+        with os.scandir(sample_pdf.parent) as it:
+            entry = next(e for e in it if e.name == sample_pdf.name)
+
+        info = FileInfo.from_dirent(entry)
+
+        assert info == FileInfo.from_path(sample_pdf)
+
 
 class TestDetectionResult:
     """Tests for DetectionResult dataclass."""
@@ -74,6 +121,14 @@ class TestDetectionResult:
 
         assert result.is_confident(0.7) is False
 
+    def test_is_confident_defaults_to_0_7(self) -> None:
+        """is_confident uses the 0.7 default threshold and tracks confidence."""
+        result = DetectionResult("Documents", 0.69, "GenericDetector")
+        assert result.is_confident() is False
+
+        result.confidence = 0.7
+        assert result.is_confident() is True
+
     def test_to_dict_includes_reason_when_present(self) -> None:
         """to_dict includes reason field when set."""
         result = DetectionResult(